@@ -124,7 +124,7 @@ class ApdKritisHarvester(CustomDcatHarvester):
 
         try:
             conf = json.loads(source_config) or {}
-        except ValueError:
+        except json.JSONDecodeError:
             # Delegate to parent for consistent error handling
             return super().validate_config(source_config)
 
@@ -1,12 +1,26 @@
+import codecs
+import copy
+import functools
 import hashlib
+import itertools
 import json
 import logging
 import re
-from collections import defaultdict
-from urllib.parse import urljoin, urlparse
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+try:
+    # bs4 >= 4.13
+    from bs4 import ElementFilter
+except ImportError:
+    ElementFilter = None
 
 import ckan.plugins as p
 from ckan import model
@@ -17,12 +31,220 @@ from ckanext.harvest.model import HarvestObject
 
 log = logging.getLogger(__name__)
 
+_RE_NONWORD = re.compile(r'[^a-z0-9-_]')
+_RE_DASHES = re.compile(r'-+')
+
+# Καθαρισμός tags: προβληματικοί χαρακτήρες -> παύλα ή αφαίρεση, σε ένα πέρασμα
+_TAG_TRANSLATE = str.maketrans({
+    '"': None, "'": None, '«': None, '»': None,
+    '(': '-', ')': '-', '[': '-', ']': '-',
+    '/': '-', '\\': '-', '–': '-', '—': '-',
+    ',': None, ';': None, ':': None,
+})
+# Ό,τι δεν είναι alphanumeric, κενό, παύλα, underscore ή τελεία (\w = isalnum() + '_')
+_TAG_INVALID_RE = re.compile(r'[^\w .\-]')
+
+# Tags που μένουν μόνο από σύμβολα μετά τον καθαρισμό
+_INVALID_TAG_NAMES = frozenset({'-', '--', '---', '.', '..', '...', '_', '__', '___'})
+
+# Paths του breadcrumb που δεν είναι δημιουργοί (home, "Ανοιχτά δεδομένα")
+_IGNORED_BREADCRUMB_PATHS = frozenset({'', '/', '/content'})
+
+# Μέγεθος resource, π.χ. "28 KB", "1.5mb", "300 bytes"
+_SIZE_RE = re.compile(r'^([\d.]+)\s*(kb|mb|gb|bytes?|b)?$', re.IGNORECASE)
+_SIZE_UNIT_MULTIPLIERS = {
+    '': 1,
+    'b': 1,
+    'byte': 1,
+    'bytes': 1,
+    'kb': 1024,
+    'mb': 1024 * 1024,
+    'gb': 1024 * 1024 * 1024,
+}
+
+# (key στο dataset_data, key στα extras του πακέτου):
+#   - high value category (DCAT-AP σχετικό πεδίο που μπορείς να κάνεις map μετά)
+#   - πληροφορίες χρόνου από το τρίτο σύστημα (όχι τα CKAN system fields)
+#   - raw organization/category για εύκολα mappings
+_EXTRAS_KEY_MAP = (
+    ('high_value_category', 'high_value_category'),
+    ('metadata_created', 'source_metadata_created'),
+    ('metadata_modified', 'source_metadata_modified'),
+    ('organization', 'source_organization'),
+    ('category', 'source_category'),
+)
+
+_ATTICA_EMAIL = 'opendata @patt.gov.gr'
+_ATTICA_PORTAL_URL = 'https://opendata.attica.gov.gr/'
+
+# Σταθερά υποπεδία κάθε creator (τα uri/name/identifier προκύπτουν από το breadcrumb)
+_CREATOR_TEMPLATE = {
+    'description': '',
+    'email': _ATTICA_EMAIL,
+    'url': _ATTICA_PORTAL_URL,
+    'type': '',
+}
+
+# Σταθερά DCAT πεδία για όλα τα datasets της Περιφέρειας Αττικής.
+# Τα dicts αντιγράφονται ανά πακέτο, ώστε να μη μοιράζονται μεταξύ πακέτων.
+_ACCESS_RIGHTS_PUBLIC = 'http://publications.europa.eu/resource/authority/access-right/PUBLIC'
+_APPLICABLE_LEGISLATION = ('https://eur-lex.europa.eu/eli/dir/2019/1024/oj/eng',)
+_LANGUAGE_OPTIONS = ('http://publications.europa.eu/resource/authority/language/ELL',)
+_CONTACT_INFO = ({
+    "uri": _ATTICA_PORTAL_URL,
+    "name": "Περιφέρεια Αττικής",
+    "email": _ATTICA_EMAIL,
+    "url": "https://www.patt.gov.gr/7_epikoinonia/epikoinonia/"
+},)
+_SPATIAL_COVERAGE = ({
+    "uri": "",
+    "text": "Περιφέρεια Αττικής",
+    "geom": "",
+    "bbox": "{ \"type\": \"Polygon\", \"coordinates\": [[[22.90, 37.50], [22.90, 38.40], [24.40, 38.40], [24.40, 37.50], [22.90, 37.50]]] }",
+    "centroid": "{\"type\": \"Point\", \"coordinates\": [23.65, 37.95]}"
+},)
+
+
+@functools.lru_cache(maxsize=4096)
+def _package_id_for_url(dataset_url):
+    """
+    Unique package ID (md5 hex) από το URL του dataset.
+
+    Το id αποθηκεύεται στα πακέτα που έχουν ήδη γίνει harvest και με αυτό
+    εντοπίζονται στις επόμενες εκτελέσεις, οπότε ο αλγόριθμος hash δεν
+    πρέπει να αλλάξει (το κόστος του md5 καλύπτεται από το lru_cache).
+    """
+    return hashlib.md5(dataset_url.encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def _dataset_name_for_url(dataset_url):
+    """
+    Έγκυρο CKAN name από το URL του dataset.
+    """
+    parsed_url = urlsplit(dataset_url)
+    path_parts = [p for p in parsed_url.path.split('/') if p and p != 'content']
+
+    # Use the last part of the path as base name
+    if path_parts:
+        base_name = path_parts[-1]
+    else:
+        base_name = 'attica-dataset'
+
+    # Clean and ensure it's a valid CKAN name
+    name = _RE_NONWORD.sub('-', base_name.lower())
+    name = _RE_DASHES.sub('-', name)  # Replace multiple dashes with single
+    name = name.strip('-')  # Remove leading/trailing dashes
+
+    # Ensure it starts with letter or number
+    if name and not name[0].isalnum():
+        name = 'attica-' + name
+
+    # Add prefix to avoid conflicts
+    return f"attica-{name}"
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_source_config(source_config):
+    """
+    JSON parse του config του harvest source (cached ανά config string).
+    Το αποτέλεσμα είναι κοινόχρηστο· οι callers το παίρνουν μέσω του
+    _get_source_config, που επιστρέφει αντίγραφο.
+    """
+    try:
+        return json.loads(source_config)
+    except (ValueError, TypeError):
+        log.error(f"Invalid source config: {source_config}")
+        return {}
+
+
+def _keep_dataset_page_tag(name, attrs):
+    """
+    Αν ένα tag της σελίδας dataset είναι από τα στοιχεία που διαβάζουν οι
+    _extract_* μέθοδοι (κρατιούνται μαζί με τους απογόνους τους).
+    """
+    if name == 'h1':
+        return True
+    attrs = attrs or {}
+    if name == 'section':
+        return attrs.get('id') in ('dataset-resources', 'additional-info', 'tags')
+    if name == 'nav':
+        return attrs.get('aria-label') == 'breadcrumb'
+
+    classes = attrs.get('class') or ()
+    if isinstance(classes, str):
+        classes = classes.split()
+    if name == 'div':
+        return 'description' in classes or 'datetime' in classes
+    if name == 'span':
+        return 'updated' in classes
+    return False
+
+
+if ElementFilter is not None:
+    class _DatasetPageFilter(ElementFilter):
+        """
+        Φίλτρο parsing της σελίδας dataset για bs4 >= 4.13, με τον τρόπο που
+        ορίζει το ElementFilter: subclass με allow_tag_creation /
+        allow_string_creation. Ένα SoupStrainer με function εκεί παίρνει μόνο
+        το όνομα του tag, όχι τα attributes.
+        """
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return _keep_dataset_page_tag(name, attrs)
+
+        def allow_string_creation(self, string):
+            # Κείμενα εκτός των στοιχείων που κρατάμε
+            return False
+
+    _DATASET_PAGE_STRAINER = _DatasetPageFilter()
+else:
+    # Στο bs4 < 4.13 το SoupStrainer καλεί τη function με (name, attrs)
+    _DATASET_PAGE_STRAINER = SoupStrainer(_keep_dataset_page_tag)
+
+
 class AtticaOpenDataHarvester(CKANHarvester):
     """
     Custom harvester for Attica Region Open Data portal
     Harvests from https://opendata.attica.gov.gr/content
     """
 
+    # Parser του BeautifulSoup για όλες τις σελίδες του portal (lxml: γρηγορότερος από html.parser)
+    HTML_PARSER = 'lxml'
+
+    # Parsing μόνο των τμημάτων της σελίδας που χρειαζόμαστε (False για πλήρες parsing)
+    USE_SOUP_STRAINERS = True
+    DATASET_PAGE_STRAINER = _DATASET_PAGE_STRAINER
+
+    # Πλήθος παράλληλων GET στις σελίδες resources (κοινό pool για όλα τα datasets)
+    RESOURCE_FETCH_WORKERS = 4
+
+    # Μέγεθος chunk για το streaming parsing των σελίδων resources
+    RESOURCE_PAGE_CHUNK_SIZE = 64 * 1024
+
+    # Bytes στην αρχή της σελίδας resource όπου αναζητείται <meta charset> (όπως στο HTML prescan)
+    RESOURCE_PAGE_PRESCAN_SIZE = 1024
+
+    # Πόσες σελίδες λίστας (gather / κατηγορίες) κατεβαίνουν μπροστά από την τρέχουσα
+    LISTING_PREFETCH_PAGES = 4
+
+    # Μέγιστο πλήθος σελίδων resources στην cache (οι παλαιότερες βγαίνουν πρώτες)
+    RESOURCE_PAGE_CACHE_SIZE = 2048
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # preview_url -> {'etag', 'last_modified', 'info'} για τις σελίδες resources.
+        # Δημιουργείται εδώ και όχι lazily, γιατί τη χρησιμοποιούν ταυτόχρονα
+        # τα threads του _resource_executor.
+        self._resource_page_cache = OrderedDict()
+        self._resource_page_cache_lock = threading.Lock()
+        # Ένα pool για τα GET στις σελίδες resources, για όλη τη ζωή του harvester.
+        # Τα threads ξεκινούν όταν χρειαστούν και ξαναχρησιμοποιούνται ανά dataset.
+        self._resource_executor = ThreadPoolExecutor(
+            max_workers=self.RESOURCE_FETCH_WORKERS,
+            thread_name_prefix='attica-resource-page',
+        )
+
     # ##################################################################################################################
 
     # ------------------------------------------------------------------
@@ -48,6 +270,9 @@ class AtticaOpenDataHarvester(CKANHarvester):
         'παιδεία – πολιτισμός – αθλητισμός': 'EDUC',
     }
 
+    # Lazy cache του CATEGORY_LABEL_THEME_MAP με κανονικοποιημένα keys (βλ. _get_theme_map)
+    _theme_map = None
+
     def _normalize_category_label(self, label):
         """
         Helper: normalize label για lookup στο CATEGORY_LABEL_THEME_MAP
@@ -59,6 +284,20 @@ class AtticaOpenDataHarvester(CKANHarvester):
         norm = ' '.join(norm.split())
         return norm.lower()
 
+    def _get_theme_map(self):
+        """
+        Helper: CATEGORY_LABEL_THEME_MAP με ήδη κανονικοποιημένα keys.
+        Υπολογίζεται μία φορά ανά κλάση. Περιέχει και τα αρχικά keys, ώστε
+        τα labels που ταιριάζουν αυτούσια να μη χρειάζονται κανονικοποίηση.
+        """
+        cls = type(self)
+        if cls._theme_map is None:
+            theme_map = dict(cls.CATEGORY_LABEL_THEME_MAP)
+            for label, theme_code in cls.CATEGORY_LABEL_THEME_MAP.items():
+                theme_map[self._normalize_category_label(label)] = theme_code
+            cls._theme_map = theme_map
+        return cls._theme_map
+
     def _get_portal_collections(self, base_url):
         """
         Διαβάζει από το portal της περιφέρειας τις κατηγορίες και επιστρέφει
@@ -73,7 +312,7 @@ class AtticaOpenDataHarvester(CKANHarvester):
             log.warning(f"Could not fetch base URL for collections: {base_url} - {e}")
             return collections
 
-        soup = BeautifulSoup(resp.content, 'html.parser')
+        soup = BeautifulSoup(resp.content, self.HTML_PARSER)
 
         for a in soup.find_all('a', class_='filter_set'):
             if a.get('data-filter') != 'collections':
@@ -111,47 +350,96 @@ class AtticaOpenDataHarvester(CKANHarvester):
 
             empty_pages_in_a_row = 0
 
-            for page_num in range(start_page, end_page + 1):
-                page_url = f"{base_url}?collections={filter_id}&page={page_num}"
-                log.debug(f"  Category page: {page_url}")
-
-                try:
-                    resp = requests.get(page_url, timeout=30)
-                    resp.raise_for_status()
-                except Exception as e:
-                    log.warning(f"  Error fetching category page {page_url}: {e}")
-                    break
-
-                soup = BeautifulSoup(resp.content, 'html.parser')
-                dataset_items = soup.find_all('li', class_='dataset-item')
-
-                if not dataset_items:
-                    empty_pages_in_a_row += 1
-                    log.debug(f"  No datasets on page {page_num} (empty_pages_in_a_row={empty_pages_in_a_row})")
-                    if empty_pages_in_a_row >= 3:
-                        log.info(f"  Stopping category '{label}' at page {page_num} (3 empty pages in a row)")
+            category_pages = self._prefetch_listing_pages(
+                (page_num, f"{base_url}?collections={filter_id}&page={page_num}")
+                for page_num in range(start_page, end_page + 1)
+            )
+            with closing(category_pages) as pages:
+                for page_num, page_url, page_future in pages:
+                    log.debug(f"  Category page: {page_url}")
+
+                    try:
+                        soup = page_future.result()
+                    except Exception as e:
+                        log.warning(f"  Error fetching category page {page_url}: {e}")
                         break
-                    continue
 
-                empty_pages_in_a_row = 0
+                    dataset_items = soup.find_all('li', class_='dataset-item')
 
-                for item in dataset_items:
-                    dataset_heading = item.find('h3', class_='dataset-heading')
-                    if not dataset_heading:
+                    if not dataset_items:
+                        empty_pages_in_a_row += 1
+                        log.debug(f"  No datasets on page {page_num} (empty_pages_in_a_row={empty_pages_in_a_row})")
+                        if empty_pages_in_a_row >= 3:
+                            log.info(f"  Stopping category '{label}' at page {page_num} (3 empty pages in a row)")
+                            break
                         continue
 
-                    link = dataset_heading.find('a')
-                    if not link or not link.get('href'):
-                        continue
+                    empty_pages_in_a_row = 0
+
+                    for item in dataset_items:
+                        dataset_heading = item.find('h3', class_='dataset-heading')
+                        if not dataset_heading:
+                            continue
 
-                    dataset_url = link['href']
-                    if not dataset_url.startswith('http'):
-                        dataset_url = urljoin(base_url, dataset_url)
+                        link = dataset_heading.find('a')
+                        if not link or not link.get('href'):
+                            continue
 
-                    dataset_to_categories[dataset_url].add(label)
+                        dataset_url = link['href']
+                        if not dataset_url.startswith('http'):
+                            dataset_url = urljoin(base_url, dataset_url)
+
+                        dataset_to_categories[dataset_url].add(label)
 
         return dataset_to_categories
 
+    def _prefetch_listing_pages(self, pages):
+        """
+        Κατεβάζει και κάνει parse σελίδες λίστας σε thread pool, έως
+        LISTING_PREFETCH_PAGES σελίδες μπροστά από αυτή που επεξεργάζεται ο caller.
+
+        Δέχεται (page_num, page_url) και κάνει yield (page_num, page_url, future)
+        με τη σειρά των σελίδων· το future.result() επιστρέφει το soup ή κάνει
+        raise το σφάλμα του fetch. Αν ο caller σταματήσει νωρίτερα (break),
+        οι σελίδες που δεν έχουν ξεκινήσει ακυρώνονται.
+        """
+        pages = iter(pages)
+        executor = ThreadPoolExecutor(max_workers=self.LISTING_PREFETCH_PAGES)
+        try:
+            pending = deque()
+            for page_num, page_url in pages:
+                pending.append((page_num, page_url, executor.submit(self._fetch_listing_page, page_url)))
+                if len(pending) >= self.LISTING_PREFETCH_PAGES:
+                    break
+
+            while pending:
+                page_num, page_url, future = pending.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    next_num, next_url = next_page
+                    pending.append((next_num, next_url, executor.submit(self._fetch_listing_page, next_url)))
+                yield page_num, page_url, future
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fetch_listing_page(self, page_url):
+        """
+        GET + parse μιας σελίδας λίστας datasets.
+        """
+        response = requests.get(page_url, timeout=30)
+        response.raise_for_status()
+        return BeautifulSoup(response.content, self.HTML_PARSER)
+
+    # ##################################################################################################################
+
+    def _parse_html(self, content, strainer=None):
+        """
+        Parse HTML με τον HTML_PARSER, περιορισμένο στο strainer αν είναι ενεργά τα strainers.
+        """
+        if strainer is not None and self.USE_SOUP_STRAINERS:
+            return BeautifulSoup(content, self.HTML_PARSER, parse_only=strainer)
+        return BeautifulSoup(content, self.HTML_PARSER)
+
     # ##################################################################################################################
 
     def _create_or_update_package(self, package_dict, harvest_object, package_dict_form='package_show'):
@@ -273,58 +561,59 @@ class AtticaOpenDataHarvester(CKANHarvester):
         empty_pages_in_a_row = 0
 
         # 1. Βάση: σκανάρισμα /content?page=N
-        for page_num in range(start_page, end_page + 1):
-            page_url = f"{base_url}?page={page_num}"
-            log.info(f"Gathering datasets from page {page_num}: {page_url}")
-
-            try:
-                response = requests.get(page_url, timeout=30)
-                response.raise_for_status()
-
-                # Parse HTML with BeautifulSoup
-                soup = BeautifulSoup(response.content, 'html.parser')
+        listing_pages = self._prefetch_listing_pages(
+            (page_num, f"{base_url}?page={page_num}")
+            for page_num in range(start_page, end_page + 1)
+        )
+        with closing(listing_pages) as pages:
+            for page_num, page_url, page_future in pages:
+                log.info(f"Gathering datasets from page {page_num}: {page_url}")
 
-                # Find dataset items
-                dataset_items = soup.find_all('li', class_='dataset-item')
+                try:
+                    # Fetch + parse HTML with BeautifulSoup (έχει ήδη ξεκινήσει στο thread pool)
+                    soup = page_future.result()
 
-                if not dataset_items:
-                    empty_pages_in_a_row += 1
-                    log.warning(f"No dataset items found on page {page_num} (empty_pages_in_a_row={empty_pages_in_a_row})")
+                    # Find dataset items
+                    dataset_items = soup.find_all('li', class_='dataset-item')
 
-                    if empty_pages_in_a_row >= 3:
-                        log.info(
-                            f"No dataset items found for {empty_pages_in_a_row} consecutive pages. "
-                            f"Stopping gather at page {page_num}."
-                        )
-                        break
+                    if not dataset_items:
+                        empty_pages_in_a_row += 1
+                        log.warning(f"No dataset items found on page {page_num} (empty_pages_in_a_row={empty_pages_in_a_row})")
 
-                    continue
+                        if empty_pages_in_a_row >= 3:
+                            log.info(
+                                f"No dataset items found for {empty_pages_in_a_row} consecutive pages. "
+                                f"Stopping gather at page {page_num}."
+                            )
+                            break
 
-                # Αν βρήκες datasets, μηδένισε τον counter
-                empty_pages_in_a_row = 0
+                        continue
 
-                # Extract dataset URLs
-                for item in dataset_items:
-                    dataset_heading = item.find('h3', class_='dataset-heading')
-                    if dataset_heading:
-                        link = dataset_heading.find('a')
-                        if link and link.get('href'):
-                            dataset_url = link['href']
-                            if not dataset_url.startswith('http'):
-                                dataset_url = urljoin(base_url, dataset_url)
-                            if dataset_url not in seen_urls:
-                                # Μέριμνα για αποφυγή αποθήκευσης ως harvest object dataset που έχει ήδη καταχωρηθεί
-                                seen_urls.add(dataset_url)
-                                dataset_urls.append(dataset_url)
-                            else:
-                                log.debug(f"Duplicate dataset URL skipped: {dataset_url}")
-                            log.debug(f"Found dataset: {dataset_url}")
-
-                log.info(f"Found {len(dataset_items)} datasets on page {page_num}")
+                    # Αν βρήκες datasets, μηδένισε τον counter
+                    empty_pages_in_a_row = 0
+
+                    # Extract dataset URLs
+                    for item in dataset_items:
+                        dataset_heading = item.find('h3', class_='dataset-heading')
+                        if dataset_heading:
+                            link = dataset_heading.find('a')
+                            if link and link.get('href'):
+                                dataset_url = link['href']
+                                if not dataset_url.startswith('http'):
+                                    dataset_url = urljoin(base_url, dataset_url)
+                                if dataset_url not in seen_urls:
+                                    # Μέριμνα για αποφυγή αποθήκευσης ως harvest object dataset που έχει ήδη καταχωρηθεί
+                                    seen_urls.add(dataset_url)
+                                    dataset_urls.append(dataset_url)
+                                else:
+                                    log.debug(f"Duplicate dataset URL skipped: {dataset_url}")
+                                log.debug(f"Found dataset: {dataset_url}")
+
+                    log.info(f"Found {len(dataset_items)} datasets on page {page_num}")
 
-            except Exception as e:
-                log.error(f"Error gathering from page {page_num}: {str(e)}")
-                continue
+                except Exception as e:
+                    log.error(f"Error gathering from page {page_num}: {str(e)}")
+                    continue
 
         log.info(f"Total datasets found (unique): {len(dataset_urls)}")
 
@@ -385,7 +674,7 @@ class AtticaOpenDataHarvester(CKANHarvester):
             response.raise_for_status()
 
             # Parse HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = self._parse_html(response.content, self.DATASET_PAGE_STRAINER)
 
             # Extract dataset metadata
             dataset_data = self._extract_dataset_metadata(soup, dataset_url)
@@ -443,18 +732,25 @@ class AtticaOpenDataHarvester(CKANHarvester):
     def _extract_dataset_metadata(self, soup, dataset_url):
         """
         Extract dataset metadata from HTML soup (individual dataset page)
+
+        Τα GET στις σελίδες των resources ξεκινούν πρώτα στο pool του harvester,
+        ώστε η αναμονή του δικτύου να επικαλύπτεται με το parsing της σελίδας
+        του dataset που γίνεται στο κύριο thread. Τα workers μόνο επιστρέφουν
+        τα πεδία κάθε σελίδας· τα dicts του dataset αλλάζουν μόνο εδώ.
         """
         dataset_data = {
             'url': dataset_url,
             'resources': []
         }
 
+        # Πόροι (resources)· οι σελίδες τους κατεβαίνουν στο παρασκήνιο
+        pending = self._extract_resources(
+            dataset_data, soup, dataset_url, executor=self._resource_executor
+        )
+
         # Βασικά πεδία (τίτλος, περιγραφή, created/updated από main sections)
         self._extract_basic_metadata(dataset_data, soup)
 
-        # Πόροι (resources) + εμπλουτισμός από resource pages
-        self._extract_resources(dataset_data, soup, dataset_url)
-
         # Επιπλέον πληροφορίες από τον πίνακα "additional-info"
         self._extract_additional_info(dataset_data, soup)
 
@@ -475,6 +771,10 @@ class AtticaOpenDataHarvester(CKANHarvester):
         # Δημιουργοί από το breadcrumb
         self._extract_creators_from_breadcrumb(dataset_data, soup, dataset_url)
 
+        # Εμπλουτισμός των resources με ό,τι βρήκαν τα workers
+        for resource_data, future in pending:
+            self._apply_resource_page_info(resource_data, future.result())
+
         return dataset_data
 
     def _extract_basic_metadata(self, dataset_data, soup):
@@ -511,14 +811,21 @@ class AtticaOpenDataHarvester(CKANHarvester):
                     'Τελευταία ανανέωση:', ''
                 ).strip()
 
-    def _extract_resources(self, dataset_data, soup, dataset_url):
+    def _extract_resources(self, dataset_data, soup, dataset_url, executor=None):
         """
         Εξαγωγή λίστας resources από το #dataset-resources section.
         Εμπλουτισμός κάθε resource από τη σελίδα του.
+
+        Αν δοθεί executor, το GET κάθε σελίδας υποβάλλεται σε αυτόν και
+        επιστρέφεται λίστα (resource_data, future)· το future δίνει τα πεδία
+        της σελίδας, που εφαρμόζει ο caller. Αλλιώς ο εμπλουτισμός γίνεται
+        εδώ σειριακά.
         """
+        pending = []
+
         resources_section = soup.find('section', id='dataset-resources')
         if not resources_section:
-            return
+            return pending
 
         resource_items = resources_section.find_all('li', class_='resource-item')
         for item in resource_items:
@@ -526,10 +833,19 @@ class AtticaOpenDataHarvester(CKANHarvester):
 
             # Εμπλουτισμός από τη σελίδα του resource
             if resource_data.get('preview_url'):
-                self._enrich_resource_from_page(resource_data, resource_data['preview_url'])
+                if executor is not None:
+                    pending.append((resource_data, executor.submit(
+                        self._get_resource_page_info, resource_data['preview_url']
+                    )))
+                else:
+                    self._apply_resource_page_info(
+                        resource_data, self._get_resource_page_info(resource_data['preview_url'])
+                    )
 
             dataset_data['resources'].append(resource_data)
 
+        return pending
+
     def _extract_single_resource(self, item, dataset_url):
         """
         Εξαγωγή δεδομένων για ένα resource item.
@@ -660,7 +976,7 @@ class AtticaOpenDataHarvester(CKANHarvester):
         Εξαγωγή organization/category από το path του URL.
         Πχ /content/<org>/<category>/...
         """
-        parsed_url = urlparse(dataset_url)
+        parsed_url = urlsplit(dataset_url)
         path_parts = [p for p in parsed_url.path.split('/') if p]
 
         if len(path_parts) >= 3:
@@ -681,55 +997,175 @@ class AtticaOpenDataHarvester(CKANHarvester):
         # Αν θέλεις και default license_id:
         # dataset_data.setdefault('license_id', 'other-open')
 
-    def _enrich_resource_from_page(self, resource_data, resource_page_url):
+    def _get_resource_page_info(self, resource_page_url):
         """
-        Κάνει HTTP GET στη σελίδα του resource (file_page) και
-        εμπλουτίζει το resource_data με metadata από το #additional-info.
+        Κάνει HTTP GET στη σελίδα του resource (file_page) και επιστρέφει
+        τα metadata του #additional-info ως dict (κενό αν η σελίδα δεν
+        διαβάστηκε). Τρέχει στα threads του _resource_executor, οπότε δεν
+        αλλάζει το resource_data· αυτό γίνεται με το _apply_resource_page_info.
+
+        Οι σελίδες που έχουμε ήδη διαβάσει κρατιούνται σε cache ανά URL μαζί με
+        τα ETag / Last-Modified headers τους. Σε επόμενη επίσκεψη στέλνουμε
+        conditional GET και, αν ο server απαντήσει 304, ξαναχρησιμοποιούμε τα
+        ήδη εξαγμένα πεδία χωρίς νέο parsing.
+
+        Η απάντηση διαβάζεται ως stream (βλ. _parse_resource_page_info).
         """
+        with self._resource_page_cache_lock:
+            cached = self._resource_page_cache.get(resource_page_url)
+            if cached:
+                self._resource_page_cache.move_to_end(resource_page_url)
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         try:
-            resp = requests.get(resource_page_url, timeout=30)
-            resp.raise_for_status()
+            resp = requests.get(resource_page_url, headers=headers, timeout=30, stream=True)
         except Exception as e:
             log.warning(f"Could not fetch resource page {resource_page_url}: {e}")
-            return
+            return {}
 
-        try:
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            additional_info_section = soup.find('section', id='additional-info')
-            if not additional_info_section:
-                return
+        with resp:
+            try:
+                resp.raise_for_status()
+            except Exception as e:
+                log.warning(f"Could not fetch resource page {resource_page_url}: {e}")
+                return {}
 
-            table = additional_info_section.find('table')
-            if not table:
-                return
+            if cached and resp.status_code == 304:
+                log.debug(f"Resource page not modified, using cached info: {resource_page_url}")
+                return cached['info']
 
-            rows = table.find_all('tr')
-            for row in rows[1:]:  # skip header
-                cells = row.find_all('td')
-                if len(cells) < 2:
-                    continue
-                field = cells[0].get_text().strip()
-                value = cells[1].get_text().strip()
-
-                # Map ελληνικά labels σε keys του resource_data
-                if field == 'Ημερομηνία καταχώρησης':
-                    # θα το κρατήσουμε και ως plain string, και σε extra
-                    resource_data['created'] = value
-                elif field == 'Έτος':
-                    resource_data['year'] = value
-                elif field == 'Τύπος αρχείου':
-                    # π.χ. XLS, CSV κλπ. Μπορεί να "διορθώσει" το format
-                    resource_data.setdefault('format', value)
-                    resource_data['file_type'] = value
-                elif field == 'Mime type':
-                    resource_data['mimetype'] = value
-                elif field == 'Μέγεθος':
-                    resource_data['size'] = value  # αφήνουμε το "28 KB" ως string
-                elif field == 'SHA1 HASH':
-                    resource_data['hash'] = value
+            try:
+                info = self._parse_resource_page_info(resp)
+            except Exception as e:
+                log.warning(f"Error parsing resource page {resource_page_url}: {e}")
+                return {}
 
-        except Exception as e:
-            log.warning(f"Error parsing resource page {resource_page_url}: {e}")
+        # Κρατάμε μόνο σελίδες με validator: χωρίς ETag / Last-Modified δεν
+        # γίνεται ποτέ conditional GET και η εγγραφή θα ήταν απλώς μνήμη
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        with self._resource_page_cache_lock:
+            cache = self._resource_page_cache
+            if etag or last_modified:
+                cache[resource_page_url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'info': info,
+                }
+                cache.move_to_end(resource_page_url)
+                while len(cache) > self.RESOURCE_PAGE_CACHE_SIZE:
+                    cache.popitem(last=False)
+            else:
+                cache.pop(resource_page_url, None)
+        return info
+
+    def _parse_resource_page_info(self, resp):
+        """
+        Εξάγει τα πεδία του #additional-info από τη σελίδα ενός resource
+        και τα επιστρέφει ως dict με τα keys του resource_data.
+
+        Τα chunks της απάντησης περνούν σε lxml HTMLPullParser καθώς φτάνουν
+        και η ανάγνωση σταματά μόλις κλείσει ο πίνακας του #additional-info,
+        χωρίς να κατέβει (ή να γίνει parse) το υπόλοιπο HTML.
+        """
+        info = {}
+
+        # Η αρχή της σελίδας (τουλάχιστον RESOURCE_PAGE_PRESCAN_SIZE bytes,
+        # όσο μικρό κι αν είναι το chunk) κρίνει το encoding του parser
+        chunks = resp.iter_content(chunk_size=self.RESOURCE_PAGE_CHUNK_SIZE)
+        head = b''
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= self.RESOURCE_PAGE_PRESCAN_SIZE:
+                break
+        parser = etree.HTMLPullParser(
+            events=('end',), tag='table',
+            encoding=self._get_stream_encoding(resp, head),
+        )
+
+        table = None
+        for chunk in itertools.chain((head,), chunks):
+            parser.feed(chunk)
+            table = self._find_additional_info_table(parser.read_events())
+            if table is not None:
+                break
+        else:
+            parser.close()
+            table = self._find_additional_info_table(parser.read_events())
+
+        if table is None:
+            return info
+
+        rows = list(table.iter('tr'))
+        for row in rows[1:]:  # skip header
+            cells = list(row.iter('td'))
+            if len(cells) < 2:
+                continue
+            field = cells[0].xpath('string()').strip()
+            value = cells[1].xpath('string()').strip()
+
+            # Map ελληνικά labels σε keys του resource_data
+            if field == 'Ημερομηνία καταχώρησης':
+                # θα το κρατήσουμε και ως plain string, και σε extra
+                info['created'] = value
+            elif field == 'Έτος':
+                info['year'] = value
+            elif field == 'Τύπος αρχείου':
+                # π.χ. XLS, CSV κλπ. Μπορεί να "διορθώσει" το format
+                info['file_type'] = value
+            elif field == 'Mime type':
+                info['mimetype'] = value
+            elif field == 'Μέγεθος':
+                info['size'] = value  # αφήνουμε το "28 KB" ως string
+            elif field == 'SHA1 HASH':
+                info['hash'] = value
+
+        return info
+
+    def _find_additional_info_table(self, events):
+        """
+        Ο (εξωτερικός) πίνακας μέσα στο section #additional-info από τα
+        ('end', table) events του HTMLPullParser, ή None.
+        """
+        for _event, table in events:
+            if table.xpath('ancestor::section[@id="additional-info"]') and not table.xpath('ancestor::table'):
+                return table
+        return None
+
+    def _get_stream_encoding(self, resp, head):
+        """
+        Encoding για τον HTMLPullParser, με τη σειρά του HTML sniffing:
+        από το BOM (το libxml2 σε push mode δεν αναγνωρίζει BOM UTF-16),
+        από το Content-Type αν δηλώνει charset, από το <meta charset> αν
+        υπάρχει στην αρχή της σελίδας (το διαβάζει ο ίδιος ο parser),
+        αλλιώς utf-8 αντί για το latin-1 που υποθέτει το libxml2.
+        """
+        if head.startswith(codecs.BOM_UTF8):
+            return 'utf-8'
+        if head.startswith(codecs.BOM_UTF16_LE):
+            return 'UTF-16LE'
+        if head.startswith(codecs.BOM_UTF16_BE):
+            return 'UTF-16BE'
+        if 'charset=' in resp.headers.get('Content-Type', '').lower():
+            return resp.encoding
+        if b'charset' in head[:self.RESOURCE_PAGE_PRESCAN_SIZE].lower():
+            return None
+        return 'utf-8'
+
+    def _apply_resource_page_info(self, resource_data, info):
+        """
+        Περνάει τα πεδία από τη σελίδα του resource στο resource_data.
+        """
+        for key, value in info.items():
+            if key == 'file_type':
+                resource_data.setdefault('format', value)
+            resource_data[key] = value
 
     def _extract_tags(self, soup):
         """
@@ -775,7 +1211,13 @@ class AtticaOpenDataHarvester(CKANHarvester):
           σύμφωνα με το scheming (uri, name, description, email, url, type, identifier).
         """
 
-        nav = soup.find('nav', attrs={'aria-label': 'breadcrumb'})
+        # Με ενεργό strainer το nav είναι στοιχείο πρώτου επιπέδου του soup,
+        # οπότε δεν χρειάζεται αναζήτηση σε όλο το δέντρο
+        nav = None
+        if self.USE_SOUP_STRAINERS:
+            nav = soup.find('nav', attrs={'aria-label': 'breadcrumb'}, recursive=False)
+        if nav is None:
+            nav = soup.find('nav', attrs={'aria-label': 'breadcrumb'})
         if not nav:
             return
 
@@ -783,7 +1225,10 @@ class AtticaOpenDataHarvester(CKANHarvester):
         if not ol:
             return
 
-        breadcrumb_items = []
+        # Ένα πέρασμα: κρατάμε μόνο όσα breadcrumbs έχουν link και δεν είναι
+        # home ("/") ή "Ανοιχτά δεδομένα" ("/content"), ως (full_href, text)
+        filtered = []
+        last_li = None
         for li in ol.find_all('li'):
             a = li.find('a')
             if not a:
@@ -795,87 +1240,53 @@ class AtticaOpenDataHarvester(CKANHarvester):
             if not href or not text:
                 continue
 
-            breadcrumb_items.append({
-                'li': li,
-                'href': href,
-                'text': text
-            })
-
-        if not breadcrumb_items:
-            return
+            last_li = li
 
-        # Φιλτράρουμε home και "Ανοιχτά δεδομένα"
-        filtered = []
-        for item in breadcrumb_items:
-            href = item['href']
             # Κανονικοποίηση σε absolute URL
             full_href = urljoin(dataset_url, href)
-            parsed = urlparse(full_href)
-            path = parsed.path or '/'
-
-            path_norm = path.rstrip('/')
+            path_norm = (urlsplit(full_href).path or '/').rstrip('/')
 
             # Αγνοούμε:
             #   - "/"
             #   - "/content"
-            if path_norm in ['', '/', '/content']:
+            if path_norm in _IGNORED_BREADCRUMB_PATHS:
                 continue
 
-            item['full_href'] = full_href
-            item['path'] = path
-            filtered.append(item)
+            filtered.append((full_href, text))
 
         if not filtered:
             return
 
         # --- αφαιρούμε το τελευταίο breadcrumb αν είναι active (= dataset title) ---
         # (δηλαδή ο τίτλος του dataset, δεν τον θέλουμε ως creator)
-        last_li = breadcrumb_items[-1]['li']
-        if 'active' in last_li.get('class', []):
-            if len(filtered) >= 1:
-                filtered = filtered[:-1]
+        last_li_classes = last_li.get('class')
+        if last_li_classes and 'active' in last_li_classes:
+            filtered = filtered[:-1]
 
         if not filtered:
             # π.χ. αν όλα τα breadcrumbs εκτός home/content είναι μόνο το dataset
             return
 
-        creators = []
-
-        # 1ος δημιουργός: το ΠΡΩΤΟ στοιχείο μετά το /content
-        first_creator_item = filtered[0]
-
-        # 2ος δημιουργός: το ΠΡΟΤΕΛΕΥΤΑΙΟ στοιχείο (στην πράξη το τελευταίο μετά το κόψιμο)
-        if len(filtered) >= 2:
-            second_creator_item = filtered[-1]
-        else:
-            second_creator_item = None
-
-        def _make_creator(entry):
-            full_href = entry.get('full_href')
-            text = entry.get('text', '').strip()
-
-            parsed = urlparse(full_href)
-            path_parts = [p for p in parsed.path.split('/') if p]
+        def _make_creator(full_href, text):
+            path_parts = [p for p in urlsplit(full_href).path.split('/') if p]
             identifier = path_parts[-1] if path_parts else ''
 
+            # scheming subfields: σταθερά πεδία από το template + τα πεδία του breadcrumb
             return {
-                # scheming subfields
+                **_CREATOR_TEMPLATE,
                 'uri': full_href,
-                'name': text,
-                'description': '',
-                'email': 'opendata @patt.gov.gr',
-                'url': 'https://opendata.attica.gov.gr/',
-                'type': '',
+                'name': text.strip(),
                 'identifier': identifier,
             }
 
-        creators.append(_make_creator(first_creator_item))
+        # 1ος δημιουργός: το ΠΡΩΤΟ στοιχείο μετά το /content
+        creators = [_make_creator(*filtered[0])]
 
-        if second_creator_item and second_creator_item is not first_creator_item:
-            creators.append(_make_creator(second_creator_item))
+        # 2ος δημιουργός: το ΠΡΟΤΕΛΕΥΤΑΙΟ στοιχείο (στην πράξη το τελευταίο μετά το κόψιμο)
+        if len(filtered) >= 2:
+            creators.append(_make_creator(*filtered[-1]))
 
-        if creators:
-            dataset_data['creator'] = creators
+        dataset_data['creator'] = creators
 
     # ##################################################################################################################
 
@@ -883,8 +1294,8 @@ class AtticaOpenDataHarvester(CKANHarvester):
         """
         Generate a unique package ID from the dataset URL
         """
-        # Δημιουργία hash από το URL για unique ID
-        return hashlib.md5(dataset_url.encode('utf-8')).hexdigest()
+        # Δημιουργία hash από το URL για unique ID (memoized ανά URL)
+        return _package_id_for_url(dataset_url)
 
     # ######################################################################################
 
@@ -994,42 +1405,13 @@ class AtticaOpenDataHarvester(CKANHarvester):
 
     def _build_extras(self, dataset_data):
         """
+        Extras για τα πεδία του _EXTRAS_KEY_MAP που έχουν τιμή στο dataset_data.
         """
         extras = []
-
-        # High value category (DCAT-AP σχετικό πεδίο που μπορείς να κάνεις map μετά)
-        if dataset_data.get('high_value_category'):
-            extras.append({
-                'key': 'high_value_category',
-                'value': dataset_data['high_value_category']
-            })
-
-        # Πληροφορίες χρόνου από το τρίτο σύστημα (όχι τα CKAN system fields)
-        if dataset_data.get('metadata_created'):
-            extras.append({
-                'key': 'source_metadata_created',
-                'value': dataset_data['metadata_created']
-            })
-
-        if dataset_data.get('metadata_modified'):
-            extras.append({
-                'key': 'source_metadata_modified',
-                'value': dataset_data['metadata_modified']
-            })
-
-        # Κρατάμε και το raw organization/category σε extras για εύκολα mappings
-        if dataset_data.get('organization'):
-            extras.append({
-                'key': 'source_organization',
-                'value': dataset_data['organization']
-            })
-
-        if dataset_data.get('category'):
-            extras.append({
-                'key': 'source_category',
-                'value': dataset_data['category']
-            })
-
+        for source_key, extra_key in _EXTRAS_KEY_MAP:
+            value = dataset_data.get(source_key)
+            if value:
+                extras.append({'key': extra_key, 'value': value})
         return extras
 
     def _apply_dcat_fields(self, package_dict, dataset_data):
@@ -1037,25 +1419,19 @@ class AtticaOpenDataHarvester(CKANHarvester):
         DCAT / access_rights / contact / publisher / temporal_coverage / spatial_coverage
         """
         package_dict['landing_page'] = dataset_data['url']
-        package_dict['access_rights'] = 'http://publications.europa.eu/resource/authority/access-right/PUBLIC'
-        package_dict['applicable_legislation'] = ['https://eur-lex.europa.eu/eli/dir/2019/1024/oj/eng']
-        package_dict['language_options'] = ['http://publications.europa.eu/resource/authority/language/ELL']
+        package_dict['access_rights'] = _ACCESS_RIGHTS_PUBLIC
+        package_dict['applicable_legislation'] = list(_APPLICABLE_LEGISLATION)
+        package_dict['language_options'] = list(_LANGUAGE_OPTIONS)
 
         # Contact
-        contact_info = [{
-            "uri": "https://opendata.attica.gov.gr/",
-            "name": "Περιφέρεια Αττικής",
-            "email": "opendata @patt.gov.gr",
-            "url": "https://www.patt.gov.gr/7_epikoinonia/epikoinonia/"
-        }]
-        package_dict['contact'] = contact_info
+        package_dict['contact'] = [dict(item) for item in _CONTACT_INFO]
 
         # Publisher (από maintainer + σταθερές τιμές)
         publisher_info = [{
             "uri": "https://opendata.attica.gov.gr/content/" + dataset_data.get('organization'),
             "name": dataset_data.get('maintainer'),
-            "email": "opendata @patt.gov.gr",
-            "url": "https://opendata.attica.gov.gr/",
+            "email": _ATTICA_EMAIL,
+            "url": _ATTICA_PORTAL_URL,
             "type": "",
             "identifier": dataset_data.get('organization')
         }]
@@ -1071,21 +1447,13 @@ class AtticaOpenDataHarvester(CKANHarvester):
         if temporal:
             package_dict['temporal_coverage'] = [temporal]
 
-        package_dict['spatial_coverage'] = [{
-            "uri": "",
-            "text": "Περιφέρεια Αττικής",
-            "geom": "",
-            "bbox": "{ \"type\": \"Polygon\", \"coordinates\": [[[22.90, 37.50], [22.90, 38.40], [24.40, 38.40], [24.40, 37.50], [22.90, 37.50]]] }",
-            "centroid": "{\"type\": \"Point\", \"coordinates\": [23.65, 37.95]}"
-        }]
+        package_dict['spatial_coverage'] = [dict(item) for item in _SPATIAL_COVERAGE]
 
         # HVD category ως URI(s) σύμφωνα με το λεξιλόγιο
         hvd_uris = self._get_hvd_category_uris(dataset_data)
         if hvd_uris:
             package_dict['hvd_category'] = hvd_uris
 
-        package_dict['landing_page'] = dataset_data['url']
-
     def _attach_resources(self, package_dict, dataset_data, package_license_id):
         """
         Χτίζει τα resource dicts και τα βάζει στο package_dict['resources'].
@@ -1153,21 +1521,12 @@ class AtticaOpenDataHarvester(CKANHarvester):
 
             if resource_data.get('size'):
                 try:
-                    size_str = str(resource_data['size']).strip().lower()
-
-                    # Αφαίρεση μονάδων και μετατροπή σε bytes
-                    if 'kb' in size_str:
-                        # Αφαίρεση "kb" και μετατροπή σε bytes
-                        size_value = float(size_str.replace('kb', '').strip()) * 1024
-                    elif 'mb' in size_str:
-                        # Αφαίρεση "mb" και μετατροπή σε bytes
-                        size_value = float(size_str.replace('mb', '').strip()) * 1024 * 1024
-                    elif 'gb' in size_str:
-                        # Αφαίρεση "gb" και μετατροπή σε bytes
-                        size_value = float(size_str.replace('gb', '').strip()) * 1024 * 1024 * 1024
-                    elif 'bytes' in size_str or 'byte' in size_str:
-                        # Αφαίρεση "bytes"/"byte"
-                        size_value = float(size_str.replace('bytes', '').replace('byte', '').strip())
+                    size_str = str(resource_data['size']).strip()
+
+                    # Αριθμός + (προαιρετική) μονάδα σε ένα πέρασμα και μετατροπή σε bytes
+                    match = _SIZE_RE.match(size_str)
+                    if match:
+                        size_value = float(match.group(1)) * _SIZE_UNIT_MULTIPLIERS[(match.group(2) or '').lower()]
                     else:
                         # Απλή μετατροπή χωρίς μονάδες
                         size_value = float(size_str)
@@ -1235,6 +1594,7 @@ class AtticaOpenDataHarvester(CKANHarvester):
         extra_tags = []
 
         base_theme_uri = "http://publications.europa.eu/resource/authority/data-theme/"
+        theme_map = self._get_theme_map()
 
         for label in portal_categories:
             if not label:
@@ -1243,9 +1603,11 @@ class AtticaOpenDataHarvester(CKANHarvester):
             # Πάντα tag
             extra_tags.append(label)
 
-            # Theme mapping
-            norm = self._normalize_category_label(label)
-            theme_code = self.CATEGORY_LABEL_THEME_MAP.get(norm)
+            # Theme mapping (κανονικοποίηση μόνο αν το label δεν ταιριάζει αυτούσιο)
+            if label in theme_map:
+                theme_code = theme_map[label]
+            else:
+                theme_code = theme_map.get(self._normalize_category_label(label))
 
             if theme_code:
                 theme_uris.add(base_theme_uri + theme_code)
@@ -1256,8 +1618,8 @@ class AtticaOpenDataHarvester(CKANHarvester):
         """
         Χτίζει τα tags και τα βάζει στο package_dict['tags'].
         """
-        tags = []
-        seen = set()
+        # normalized key (lowercase) -> tag dict, με σειρά εισαγωγής
+        tags = {}
 
         def _add_tag(tag_value):
             """
@@ -1274,29 +1636,16 @@ class AtticaOpenDataHarvester(CKANHarvester):
             if not original_name:
                 return
 
-            # Καθαρισμός μη έγκυρων χαρακτήρων
-            cleaned_name = original_name
-
-            # Αντικατάσταση προβληματικών χαρακτήρων
-            cleaned_name = cleaned_name.replace('"', '')  # Αφαίρεση εισαγωγικών
-            cleaned_name = cleaned_name.replace("'", '')  # Αφαίρεση μονών εισαγωγικών
-            cleaned_name = cleaned_name.replace('«', '')  # Αφαίρεση ελληνικών εισαγωγικών
-            cleaned_name = cleaned_name.replace('»', '')
-            cleaned_name = cleaned_name.replace('(', '-')  # Παρενθέσεις -> παύλες
-            cleaned_name = cleaned_name.replace(')', '-')
-            cleaned_name = cleaned_name.replace('[', '-')
-            cleaned_name = cleaned_name.replace(']', '-')
-            cleaned_name = cleaned_name.replace('/', '-')  # Slash -> παύλα
-            cleaned_name = cleaned_name.replace('\\', '-')  # Backslash -> παύλα
-            cleaned_name = cleaned_name.replace('–', '-')  # Em dash -> παύλα
-            cleaned_name = cleaned_name.replace('—', '-')  # En dash -> παύλα
-            cleaned_name = cleaned_name.replace(',', '')  # Αφαίρεση κόμματος
-            cleaned_name = cleaned_name.replace(';', '')  # Αφαίρεση ερωτηματικού
-            cleaned_name = cleaned_name.replace(':', '')  # Αφαίρεση άνω κάτω τελείας
-
-            # Διατήρηση μόνο έγκυρων χαρακτήρων: alphanumeric, spaces, hyphens, underscores, dots
-            cleaned_name = ''.join(char for char in cleaned_name
-                                   if char.isalnum() or char in ' -_.')
+            # Fast path: τα περισσότερα tags δεν έχουν κανέναν μη έγκυρο χαρακτήρα
+            # (όλοι οι χαρακτήρες του _TAG_TRANSLATE είναι και μη έγκυροι)
+            if _TAG_INVALID_RE.search(original_name):
+                # Αντικατάσταση/αφαίρεση προβληματικών χαρακτήρων (εισαγωγικά, παρενθέσεις, slash, παύλες κτλ.)
+                cleaned_name = original_name.translate(_TAG_TRANSLATE)
+
+                # Διατήρηση μόνο έγκυρων χαρακτήρων: alphanumeric, spaces, hyphens, underscores, dots
+                cleaned_name = _TAG_INVALID_RE.sub('', cleaned_name)
+            else:
+                cleaned_name = original_name
 
             # Καθαρισμός διπλών κενών και trim
             cleaned_name = ' '.join(cleaned_name.split())
@@ -1304,24 +1653,22 @@ class AtticaOpenDataHarvester(CKANHarvester):
             # Έλεγχος μήκους και έγκυρων τιμών
             if (not cleaned_name or
                     len(cleaned_name) < 2 or
-                    cleaned_name in ['-', '--', '---', '.', '..', '...', '_', '__', '___']):
+                    cleaned_name in _INVALID_TAG_NAMES):
                 log.debug(f"Removed invalid tag: '{original_name}' -> '{cleaned_name}'")
                 return
 
-            # normalized dedup (case-insensitive)
+            # normalized dedup (case-insensitive· τα κενά έχουν ήδη συμπτυχθεί παραπάνω)
             normalized_key = cleaned_name.lower()
-            normalized_key = ' '.join(normalized_key.split())  # collapse spaces
 
             # Έλεγχος για διπλότυπα
-            if normalized_key in seen:
+            if normalized_key in tags:
                 return
 
             # Log αν έγινε αλλαγή
             if cleaned_name != original_name:
                 log.debug(f"Cleaned tag: '{original_name}' -> '{cleaned_name}'")
 
-            seen.add(cleaned_name)
-            tags.append({'name': cleaned_name})
+            tags[normalized_key] = {'name': cleaned_name}
 
         # 1. Tags που έρχονται έτοιμα από το τρίτο σύστημα
         for t in dataset_data.get('tags', []):
@@ -1349,7 +1696,7 @@ class AtticaOpenDataHarvester(CKANHarvester):
                 _add_tag(t)
 
         if tags:
-            package_dict['tags'] = tags
+            package_dict['tags'] = list(tags.values())
 
     # ######################################################################################
 
@@ -1459,8 +1806,9 @@ class AtticaOpenDataHarvester(CKANHarvester):
         - Σε κάθε άλλη περίπτωση επιστρέφουμε start/end κανονικά.
         """
         resources = dataset_data.get("resources", []) or []
-        years = []
+        start_year = end_year = None
 
+        # Ένα πέρασμα με running min/max (χωρίς ενδιάμεση λίστα ετών)
         for res in resources:
             year = res.get("year")
             if not year:
@@ -1469,15 +1817,16 @@ class AtticaOpenDataHarvester(CKANHarvester):
             # Attempt to parse numbers safely
             try:
                 y = int(str(year).strip())
-                years.append(y)
             except Exception:
                 continue
 
-        if not years:
-            return None
+            if start_year is None or y < start_year:
+                start_year = y
+            if end_year is None or y > end_year:
+                end_year = y
 
-        start_year = min(years)
-        end_year = max(years)
+        if start_year is None:
+            return None
 
         # Ειδική περίπτωση:
         #  - ακριβώς ένας πόρος
@@ -1504,39 +1853,17 @@ class AtticaOpenDataHarvester(CKANHarvester):
         """
         Generate a unique dataset name from URL
         """
-        parsed_url = urlparse(dataset_url)
-        path_parts = [p for p in parsed_url.path.split('/') if p and p != 'content']
-
-        # Use the last part of the path as base name
-        if path_parts:
-            base_name = path_parts[-1]
-        else:
-            base_name = 'attica-dataset'
-
-        # Clean and ensure it's a valid CKAN name
-        name = re.sub(r'[^a-z0-9-_]', '-', base_name.lower())
-        name = re.sub(r'-+', '-', name)  # Replace multiple dashes with single
-        name = name.strip('-')  # Remove leading/trailing dashes
-
-        # Ensure it starts with letter or number
-        if name and not name[0].isalnum():
-            name = 'attica-' + name
-
-        # Add prefix to avoid conflicts
-        return f"attica-{name}"
+        return _dataset_name_for_url(dataset_url)
 
     # ##################################################################################################################
 
     def _get_source_config(self, source_config):
         """
         Parse source configuration
-        """
-        import json
 
+        Επιστρέφει αντίγραφο του cached αποτελέσματος, ώστε μια αλλαγή από
+        τον caller (π.χ. setdefault) να μη φτάνει στα επόμενα jobs.
+        """
         if source_config:
-            try:
-                return json.loads(source_config)
-            except (ValueError, TypeError):
-                log.error(f"Invalid source config: {source_config}")
-                return {}
-        return {}
\ No newline at end of file
+            return copy.copy(_parse_source_config(source_config))
+        return {}
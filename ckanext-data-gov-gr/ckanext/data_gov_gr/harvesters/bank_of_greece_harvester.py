@@ -1,16 +1,113 @@
 # -*- coding: utf-8 -*-
+import functools
+import itertools
+import json
 import logging
+import re
 from .custom_dcat_harvester import CustomDcatHarvester
 
 log = logging.getLogger(__name__)
 
 
+def _norm(s):
+    """Lowercase s, reusing it as-is when it has no uppercase characters."""
+    return s if s.islower() else s.lower()
+
+
+_FREQUENCY_BASE_URI = "http://publications.europa.eu/resource/authority/frequency/"
+
+_BOG_FREQUENCY_MAP = {
+    'annual': 'ANNUAL', 'annually': 'ANNUAL',
+    'semi-annual': 'ANNUAL_2', 'semiannual': 'ANNUAL_2', 'half-yearly': 'ANNUAL_2',
+    'quarterly': 'QUARTERLY', 'monthly': 'MONTHLY', 'weekly': 'WEEKLY',
+    'daily': 'DAILY', 'irregular': 'IRREG', 'not planned': 'NOT_PLANNED',
+    'never': 'NEVER', 'unknown': 'UNKNOWN',
+    # Greek
+    'ετήσια': 'ANNUAL', 'ετησια': 'ANNUAL',
+    'εξαμηνιαία': 'ANNUAL_2', 'εξαμηνιαια': 'ANNUAL_2',
+    'τριμηνιαία': 'QUARTERLY', 'τριμηνιαια': 'QUARTERLY',
+    'μηνιαία': 'MONTHLY', 'μηνιαια': 'MONTHLY',
+    'εβδομαδιαία': 'WEEKLY',
+    'ημερήσια': 'DAILY', 'ημερησια': 'DAILY'
+}
+
+# Full frequency URIs, keyed by exact text and by frequency code
+_BOG_FREQUENCY_URIS = {
+    text: _FREQUENCY_BASE_URI + code for text, code in _BOG_FREQUENCY_MAP.items()
+}
+_FREQUENCY_CODE_URIS = {
+    code: _FREQUENCY_BASE_URI + code for code in set(_BOG_FREQUENCY_MAP.values())
+}
+
+_ECON_URI = 'http://publications.europa.eu/resource/authority/data-theme/ECON'
+
+_CC_BY_40_URI = 'http://publications.europa.eu/resource/authority/licence/CC_BY_4_0'
+
+_CC_BY_40_RE = re.compile(
+    r'creativecommons\.org/licenses/by/4\.0|cc by 4\.0|attribution 4\.0|cc_by_4_0\Z',
+    re.IGNORECASE,
+)
+
+_LICENSE_HINT_KEYS = ('license_id', 'license_url', 'license_title', 'license')
+
+_RES_LICENSE_KEYS = ('license', 'license_url', 'license_title')
+
+
+def _is_cc_by_40(val):
+    # Every CC BY 4.0 spelling contains "4.0" or "4_0"; the substring checks
+    # reject most other licenses before the regex runs.
+    return (
+        isinstance(val, str)
+        and ('4.0' in val or '4_0' in val)
+        and _CC_BY_40_RE.search(val) is not None
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _bog_frequency_uri(text):
+    """
+    Frequency authority URI for an already normalized (lowercased, stripped)
+    BoG frequency text, or None. Memoized: a handful of distinct values
+    repeat across thousands of time-series datasets.
+    """
+    uri = _BOG_FREQUENCY_URIS.get(text)
+    if uri:
+        return uri
+
+    # Fuzzy checks, in priority order. For this handful of short terms
+    # plain substring tests are faster than a regex union scanning once.
+    if 'έτος' in text or 'ετήσι' in text or 'year' in text:
+        code = 'ANNUAL'
+    elif 'εξάμην' in text:
+        code = 'ANNUAL_2'
+    elif 'τρίμην' in text or 'quarter' in text:
+        code = 'QUARTERLY'
+    elif 'μήνα' in text or 'μηνιαί' in text or 'month' in text:
+        code = 'MONTHLY'
+    elif 'ημέρα' in text or 'ημερήσ' in text or 'day' in text or 'daily' in text:
+        code = 'DAILY'
+    elif 'week' in text:
+        code = 'WEEKLY'
+    else:
+        return None
+
+    return _FREQUENCY_CODE_URIS[code]
+
+
 class BankOfGreeceHarvester(CustomDcatHarvester):
     """
     Custom Harvester specifically for Bank of Greece.
     Inherits validation fixes from CustomDcatHarvester.
     """
 
+    # Only every Nth processed dataset is logged at INFO, the rest at DEBUG
+    DATASET_LOG_EVERY = 100
+    _dataset_log_counter = 0
+
+    # Mapping errors tend to repeat for every dataset of a feed; only the
+    # first one is logged with its traceback
+    _mapping_traceback_logged = False
+
     def info(self):
         return {
             'name': 'bank_of_greece_harvester',
@@ -29,14 +126,12 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
         registered RDF parser format. By forcing rdf_format=\"xml\" when
         unset, we avoid \"No plugin registered for (text/xml, ...)\" errors.
         """
-        import json
-
         if not source_config:
             return json.dumps({'rdf_format': 'xml'})
 
         try:
             conf = json.loads(source_config) or {}
-        except ValueError:
+        except json.JSONDecodeError:
             # Let the parent raise a proper error
             return super().validate_config(source_config)
 
@@ -48,7 +143,12 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
 
     def modify_package_dict(self, package_dict, temp_dict, harvest_object):
         try:
-            log.info(f"[BoG HARVESTER] Processing dataset: {package_dict.get('name', 'unknown')}")
+            self._dataset_log_counter += 1
+            if self._dataset_log_counter % self.DATASET_LOG_EVERY == 0:
+                log.info("[BoG HARVESTER] Processing dataset: %s (%d datasets processed)",
+                         package_dict.get('name', 'unknown'), self._dataset_log_counter)
+            else:
+                log.debug("[BoG HARVESTER] Processing dataset: %s", package_dict.get('name', 'unknown'))
 
             # 0. Ensure dataset name length <= 100 chars
             name = package_dict.get('name')
@@ -61,23 +161,31 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
                 original_themes = [original_themes]
 
             if original_themes:
-                current_tags = package_dict.get('tags', [])
-                existing_tag_names = {t['name'].lower() for t in current_tags if 'name' in t}
+                # Existing tag names are only indexed once a theme yields a label
+                tags_by_name = None
+                seeded = 0
 
                 for theme_val in original_themes:
                     if not theme_val or not isinstance(theme_val, str):
                         continue
                     tag_label = theme_val.strip()
-                    if 'http' in tag_label:
-                        tag_label = tag_label.rsplit('/', 1)[-1]
+                    if tag_label.startswith(('http://', 'https://')):
+                        tag_label = tag_label.rpartition('/')[2]
+
+                    if tag_label:
+                        if tags_by_name is None:
+                            current_tags = package_dict.get('tags', [])
+                            tags_by_name = {_norm(t['name']): t for t in current_tags if 'name' in t}
+                            seeded = len(tags_by_name)
+                        tags_by_name.setdefault(_norm(tag_label), {'name': tag_label})
 
-                    if tag_label and tag_label.lower() not in existing_tag_names:
-                        package_dict.setdefault('tags', []).append({'name': tag_label})
-                        existing_tag_names.add(tag_label.lower())
+                # Only the entries past the seeded ones are new theme tags
+                if tags_by_name is not None and len(tags_by_name) > seeded:
+                    new_tags = list(itertools.islice(tags_by_name.values(), seeded, None))
+                    package_dict.setdefault('tags', []).extend(new_tags)
 
             # 2. Hardcoded Theme Mapping (ECON)
-            econ_uri = 'http://publications.europa.eu/resource/authority/data-theme/ECON'
-            package_dict['theme'] = [econ_uri]
+            package_dict['theme'] = [_ECON_URI]
 
             # 3. Frequency Mapping
             if 'frequency' in package_dict:
@@ -90,7 +198,7 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
             self._map_bog_license(package_dict)
 
         except Exception as e:
-            log.error(f"[BoG HARVESTER] Error in specific mapping (pre-parent): {e}", exc_info=True)
+            self._log_mapping_error('pre-parent', e)
 
         # Call Parent Logic for standard validation fixes
         package_dict = super().modify_package_dict(package_dict, temp_dict, harvest_object)
@@ -100,49 +208,21 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
         try:
             self._map_bog_license(package_dict)
         except Exception as e:
-            log.error(f"[BoG HARVESTER] Error in specific mapping (post-parent): {e}", exc_info=True)
+            self._log_mapping_error('post-parent', e)
 
         return package_dict
 
+    def _log_mapping_error(self, stage, error):
+        if not self._mapping_traceback_logged:
+            self._mapping_traceback_logged = True
+            log.error("[BoG HARVESTER] Error in specific mapping (%s): %s", stage, error, exc_info=True)
+        else:
+            log.warning("[BoG HARVESTER] Error in specific mapping (%s): %s", stage, error)
+
     def _map_bog_frequency(self, frequency_text):
         if not frequency_text:
             return None
-        text = str(frequency_text).lower().strip()
-        base_uri = "http://publications.europa.eu/resource/authority/frequency/"
-
-        mapping = {
-            'annual': 'ANNUAL', 'annually': 'ANNUAL',
-            'semi-annual': 'ANNUAL_2', 'semiannual': 'ANNUAL_2', 'half-yearly': 'ANNUAL_2',
-            'quarterly': 'QUARTERLY', 'monthly': 'MONTHLY', 'weekly': 'WEEKLY',
-            'daily': 'DAILY', 'irregular': 'IRREG', 'not planned': 'NOT_PLANNED',
-            'never': 'NEVER', 'unknown': 'UNKNOWN',
-            # Greek
-            'ετήσια': 'ANNUAL', 'ετησια': 'ANNUAL',
-            'εξαμηνιαία': 'ANNUAL_2', 'εξαμηνιαια': 'ANNUAL_2',
-            'τριμηνιαία': 'QUARTERLY', 'τριμηνιαια': 'QUARTERLY',
-            'μηνιαία': 'MONTHLY', 'μηνιαια': 'MONTHLY',
-            'εβδομαδιαία': 'WEEKLY',
-            'ημερήσια': 'DAILY', 'ημερησια': 'DAILY'
-        }
-
-        if text in mapping:
-            return f"{base_uri}{mapping[text]}"
-
-        # Fuzzy checks
-        if 'έτος' in text or 'ετήσι' in text or 'year' in text:
-            return f"{base_uri}ANNUAL"
-        if 'εξάμην' in text:
-            return f"{base_uri}ANNUAL_2"
-        if 'τρίμην' in text or 'quarter' in text:
-            return f"{base_uri}QUARTERLY"
-        if 'μήνα' in text or 'μηνιαί' in text or 'month' in text:
-            return f"{base_uri}MONTHLY"
-        if 'ημέρα' in text or 'ημερήσ' in text or 'day' in text or 'daily' in text:
-            return f"{base_uri}DAILY"
-        if 'week' in text:
-            return f"{base_uri}WEEKLY"
-
-        return None
+        return _bog_frequency_uri(_norm(str(frequency_text).strip()))
 
     def _map_bog_license(self, package_dict):
         """
@@ -153,41 +233,42 @@ class BankOfGreeceHarvester(CustomDcatHarvester):
           - Force dataset license/license_id to the EU URI
           - Force any resource-level CC BY 4.0 license to the same URI
         """
-        valid_uri = 'http://publications.europa.eu/resource/authority/licence/CC_BY_4_0'
-
-        def _is_cc_by_40(val: str) -> bool:
-            if not isinstance(val, str):
-                return False
-            v = val.lower()
-            return (
-                'creativecommons.org/licenses/by/4.0' in v
-                or 'cc by 4.0' in v
-                or 'attribution 4.0' in v
-                or v.endswith('cc_by_4_0'.lower())
-            )
-
-        # 1) Check dataset-level hints
-        candidates = [package_dict.get(k) for k in ['license_id', 'license_url', 'license_title', 'license']]
-        found_cc = any(_is_cc_by_40(v) for v in candidates if isinstance(v, str))
+        # 1) Check dataset-level hints; re-harvested datasets already carry
+        # the EU URI, so only their resources need scanning
+        already_normalized = (
+            package_dict.get('license_id') == _CC_BY_40_URI
+            and package_dict.get('license') == _CC_BY_40_URI
+        )
+        found_cc = already_normalized or any(
+            _is_cc_by_40(package_dict.get(k)) for k in _LICENSE_HINT_KEYS
+        )
 
         # 2) Scan resource-level licenses
-        resources = package_dict.get('resources') or []
+        resources = package_dict.get('resources')
+        if not isinstance(resources, list):
+            resources = ()
         cc_resources = []
-        if isinstance(resources, list):
-            for res in resources:
-                if not isinstance(res, dict):
-                    continue
-                res_license = res.get('license') or res.get('license_url') or res.get('license_title')
-                if isinstance(res_license, str) and _is_cc_by_40(res_license):
-                    cc_resources.append(res)
+        for res in resources:
+            try:
+                get = res.get
+            except AttributeError:
+                # Not a resource dict
+                continue
+            # The first non-empty license field decides
+            for key in _RES_LICENSE_KEYS:
+                res_license = get(key)
+                if res_license:
+                    if _is_cc_by_40(res_license):
+                        cc_resources.append(res)
+                    break
 
         if not found_cc and not cc_resources:
             return
 
         # 3) Apply normalized license at dataset level
-        package_dict['license'] = valid_uri
-        package_dict['license_id'] = valid_uri
+        package_dict['license'] = _CC_BY_40_URI
+        package_dict['license_id'] = _CC_BY_40_URI
 
         # 4) Normalize resource-level licenses where we detected CC BY 4.0
         for res in cc_resources:
-            res['license'] = valid_uri
+            res['license'] = _CC_BY_40_URI
@@ -1,11 +1,88 @@
+import json
 import logging
 from datetime import timezone
 
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError, RequestException
+
 from ckanext.harvest.harvesters import HarvesterBase
+from ckanext.harvest.harvesters.ckanharvester import ContentFetchError
 from ckanext.harvest.model import HarvestObject
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger(__name__)
 
+# Extras keys that survive DataGovGrHarvester.modify_package_dict
+_HARVESTING_KEYS = frozenset({
+    'harvest_object_id',
+    'harvest_source_id',
+    'harvest_source_title',
+    'harvest_source_url',
+    'harvest_job_id',
+    'guid',
+    'source_hash',
+})
+
+# Connection pool shared by the data.gov.gr harvesters
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+HTTP_TIMEOUT = 30
+
+# Pooled transport; it is safe to mount on several sessions. Like the
+# requests default it does not retry failed requests.
+_http_adapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_CONNECTIONS,
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=0,
+)
+
+_http_session = None
+
+
+def mount_http_adapter(session):
+    '''
+    Mount the shared pooled adapter on ``session`` for http(s) URLs and
+    return it. The session keeps its own headers, auth and cookies; only
+    the connection pool is shared.
+    '''
+    session.mount('http://', _http_adapter)
+    session.mount('https://', _http_adapter)
+    return session
+
+
+def get_http_session():
+    '''
+    Return the requests session shared by the data.gov.gr harvesters, so
+    that TCP/TLS connections are reused across catalogue pages and
+    datasets instead of being re-established for every request. It lives
+    for the whole worker process.
+    '''
+    global _http_session
+    if _http_session is None:
+        _http_session = mount_http_adapter(requests.Session())
+    return _http_session
+
+
+def json_loads(content):
+    '''
+    Decode a harvest payload, preferring orjson when it is installed.
+
+    orjson is stricter than the stdlib (no NaN, no integers beyond 64 bits),
+    so anything it rejects is handed to json.loads unchanged; errors are
+    therefore the stdlib's.
+    '''
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
 
 class DataGovGrHarvester(object):
     '''
@@ -23,7 +100,7 @@ class DataGovGrHarvester(object):
         Args:
             package_dict (dict): The package dictionary to modify
         '''
-        log.info("Fixing licenses for dataset: %s", package_dict.get('title'))
+        log.debug("Fixing licenses for dataset: %s", package_dict.get('title'))
         # Implementation will be provided in subclasses
         pass
 
@@ -35,10 +112,45 @@ class DataGovGrHarvester(object):
             package_dict (dict): The package dictionary to modify
             harvest_object: The harvest object containing the remote content
         '''
-        log.info("Preserving resource names for dataset: %s", package_dict.get('title'))
+        log.debug("Preserving resource names for dataset: %s", package_dict.get('title'))
         # Implementation will be provided in subclasses
         pass
 
+    def _get_request_headers(self):
+        '''
+        Request headers for the remote API, built from the source config
+        as CKANHarvester._get_content does.
+        '''
+        headers = {}
+
+        user_agent = self.config.get('user_agent')
+        if user_agent:
+            headers['User-Agent'] = str(user_agent)
+
+        api_key = self.config.get('api_key')
+        if api_key:
+            headers['Authorization'] = api_key
+
+        return headers
+
+    def _get_content(self, url):
+        '''
+        CKANHarvester._get_content through the shared connection pool (see
+        get_http_session) and with a timeout, so that an unresponsive
+        remote cannot stall the harvest job.
+        '''
+        try:
+            http_request = get_http_session().get(
+                url, headers=self._get_request_headers(), timeout=HTTP_TIMEOUT
+            )
+        except HTTPError as e:
+            raise ContentFetchError('HTTP error: %s %s' % (e.response.status_code, e.request.url))
+        except RequestException as e:
+            raise ContentFetchError('Request error: %s' % e)
+        except Exception as e:
+            raise ContentFetchError('HTTP general exception: %s' % e)
+        return http_request.text
+
     # Start hooks
 
     def modify_package_dict(self, package_dict, harvest_object):
@@ -51,26 +163,11 @@ class DataGovGrHarvester(object):
         '''
 
         # Keep only harvesting-related metadata in extras
-        harvesting_keys = {
-            'harvest_object_id',
-            'harvest_source_id', 
-            'harvest_source_title',
-            'harvest_source_url',
-            'harvest_job_id',
-            'guid',
-            'source_hash'
-        }
-        
         if 'extras' in package_dict and isinstance(package_dict['extras'], list):
-            filtered_extras = []
-            
-            for extra in package_dict['extras']:
-                if isinstance(extra, dict) and 'key' in extra:
-                    key = extra['key']
-                    # Keep only harvesting-related keys
-                    if key in harvesting_keys:
-                        filtered_extras.append(extra)
-                        
+            filtered_extras = [
+                extra for extra in package_dict['extras']
+                if isinstance(extra, dict) and extra.get('key') in _HARVESTING_KEYS
+            ]
             package_dict['extras'] = filtered_extras
             log.info("Filtered extras to keep only harvesting metadata. Kept %d entries", len(filtered_extras))
         
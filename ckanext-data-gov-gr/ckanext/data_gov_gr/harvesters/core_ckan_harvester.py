@@ -1,6 +1,9 @@
-import json
 import logging
+import re
 import datetime
+import functools
+import threading
+import time
 from datetime import timezone
 from urllib.parse import urlparse
 
@@ -10,7 +13,7 @@ from ckanext.harvest.interfaces import IHarvester
 from ckanext.harvest.harvesters.ckanharvester import CKANHarvester
 import ckan.plugins as plugins
 
-from ckanext.data_gov_gr.harvesters.base import DataGovGrHarvester
+from ckanext.data_gov_gr.harvesters.base import DataGovGrHarvester, json_loads
 from ckanext.data_gov_gr import helpers as data_gov_helpers
 
 log = logging.getLogger(__name__)
@@ -19,6 +22,211 @@ log = logging.getLogger(__name__)
 # Define constants for tag validation
 MIN_TAG_LENGTH = 2
 MAX_TAG_LENGTH = 100
+_INVALID_TAG_CHARS = frozenset('",\'')
+
+# Characters replaced (or dropped) in tag names before the alphanumeric filter
+_TAG_CHAR_REPLACEMENTS = str.maketrans({
+    ':': '-',     # colons become hyphens
+    '+': '-plus',
+    '&': 'and',
+    '\'': '',     # apostrophes
+    '"': '',
+    '«': '',      # Greek quotes
+    '»': '',
+    '(': '',
+    ')': '',
+})
+
+# Anything other than alphanumerics, spaces, hyphens, underscores and dots;
+# \w is exactly str.isalnum() plus '_' for str patterns
+_TAG_DISALLOWED_CHARS_RE = re.compile(r'[^\w .-]')
+
+_IANA_MEDIA_TYPES_PREFIX = 'https://www.iana.org/assignments/media-types/'
+_PUBLIC_ACCESS_RIGHTS_URI = 'http://publications.europa.eu/resource/authority/access-right/PUBLIC'
+
+# Organization extras keys that may carry the publisher URI / homepage
+_PUBLISHER_URI_KEYS = frozenset(('uri', 'publisher_uri'))
+_PUBLISHER_URL_KEYS = frozenset(('url', 'website', 'homepage', 'publisher_url'))
+_MIME_TYPE_CORRECTIONS = {
+    'txt/csv': 'text/csv',  # Fix common typo
+}
+
+# Map various license formats to their correct open equivalents in CKAN.
+# Keys are uppercased so lookups only need license_id.upper().
+_LICENSE_MAPPING = {
+    # Creative Commons variations (all versions)
+    'CC-BY-4.0': 'cc-by', 'CC-BY-3.0': 'cc-by', 'CC-BY-2.5': 'cc-by', 'CC-BY-2.0': 'cc-by', 'CC-BY': 'cc-by',
+    'CC-BY-SA-4.0': 'cc-by-sa', 'CC-BY-SA-3.0': 'cc-by-sa', 'CC-BY-SA-2.5': 'cc-by-sa', 'CC-BY-SA': 'cc-by-sa',
+    'CC0': 'cc-zero', 'CC-0': 'cc-zero', 'CC0-1.0': 'cc-zero', 'CCZERO': 'cc-zero',
+    # Open Data Commons variations (all formats)
+    'ODC-BY': 'odc-by', 'ODC-ODBL': 'odc-odbl', 'ODC-PDDL': 'odc-pddl',
+    'ODBL': 'odc-odbl', 'PDDL': 'odc-pddl', 'ODC-DBY': 'odc-by',
+    'OPEN-DATA-COMMONS-BY': 'odc-by', 'OPEN-DATA-COMMONS-ODBL': 'odc-odbl', 'OPEN-DATA-COMMONS-PDDL': 'odc-pddl',
+    # GNU variations
+    'GFDL': 'gfdl', 'GNU-FDL': 'gfdl', 'GNU-FDL-1.3': 'gfdl',
+    'GNU-FREE-DOCUMENTATION-LICENSE': 'gfdl',
+    # Government and public sector licenses
+    'UK-OGL': 'uk-ogl', 'OGL': 'uk-ogl', 'OPEN-GOVERNMENT': 'uk-ogl',
+    'OPEN-GOVERNMENT-LICENCE': 'uk-ogl', 'UK-OPEN-GOVERNMENT-LICENCE': 'uk-ogl',
+    # Generic open licenses
+    'OTHER-OPEN': 'other-open', 'OTHER-PD': 'other-pd', 'OTHER-AT': 'other-at',
+    'OPEN': 'other-open', 'PUBLIC-DOMAIN': 'other-pd', 'ATTRIBUTION': 'other-at',
+    # European Union specific licenses
+    'EU-ODBL': 'odc-odbl', 'EU-PDDL': 'odc-pddl', 'EU-BY': 'odc-by',
+    # International variations
+    'CREATIVE-COMMONS-ATTRIBUTION': 'cc-by', 'CREATIVE-COMMONS-ATTRIBUTION-SHARE-ALIKE': 'cc-by-sa',
+    'CREATIVE-COMMONS-ZERO': 'cc-zero',
+    # Non-Commercial variations (mapping to closed but tracking)
+    'CC-BY-NC': 'cc-nc', 'CC-BY-NC-SA': 'cc-nc-sa', 'CREATIVE-COMMONS-NON-COMMERCIAL': 'cc-nc',
+    # Other open license variations
+    'OPENDATA-COMMONS-ATTRIBUTION': 'odc-by',
+    'OPENDATA-COMMONS-OPEN-DATABASE-LICENSE': 'odc-odbl',
+    'OPENDATA-COMMONS-PUBLIC-DOMAIN-DEDICATION': 'odc-pddl',
+}
+
+# Substrings that mark a license as likely open, matched against the
+# lowercased license id and title respectively
+_LIKELY_OPEN_ID_RE = re.compile(
+    r'cc-|cc0|odc-(?:by|odbl|pddl)|gfdl|uk-ogl|other-(?:open|pd|at)|eu-(?:odbl|pddl|by)'
+)
+_LIKELY_OPEN_TITLE_RE = re.compile(
+    r'creative commons|open ?data commons|public domain|domaine public|'
+    r'open government|government licen[cs]e|licence ouverte|'
+    r'gnu (?:free documentation|fdl)|open licen[cs]e|libre|zero'
+)
+
+# Generic open licenses to fall back to, in order of preference
+_FALLBACK_LICENSE_IDS = (
+    # Creative Commons (most common)
+    'cc-by', 'cc-by-sa', 'cc-zero',
+    # Open Data Commons
+    'odc-by', 'odc-odbl', 'odc-pddl',
+    # Generic and other
+    'other-open', 'other-pd', 'other-at',
+    # GNU and Government
+    'gfdl', 'uk-ogl',
+)
+
+# CKAN licence ids (lowercased) to EU Publications Office licence codes
+_LICENSE_ID_CODES = {
+    'cc-by': 'CC_BY_4_0',
+    'cc-by-sa': 'CC_BYSA_4_0',
+    'cc-by-nd': 'CC_BYND_4_0',
+    'cc-by-nc': 'CC_BYNC_4_0',
+    'cc-by-nc-sa': 'CC_BYNCSA_4_0',
+    'cc-by-nc-nd': 'CC_BYNCND_4_0',
+    'cc-zero': 'CC0',
+    'cc0': 'CC0',
+    'cc-nc': 'CC_BYNC_4_0',
+    'odc-odbl': 'ODC_BL',
+    'odc-pddl': 'ODC_PDDL',
+    'odc-by': 'ODC_BY',
+    'gfdl': 'GFDL_1_3',
+    'gpl': 'GPL_3_0',
+    'gpl-3.0': 'GPL_3_0',
+    'gpl-2.0': 'GPL_2_0',
+    'lgpl': 'LGPL_3_0',
+    'lgpl-3.0': 'LGPL_3_0',
+    'lgpl-2.1': 'LGPL_2_1',
+    'mit': 'MIT',
+    'apache': 'APACHE_2_0',
+    'apache-2.0': 'APACHE_2_0',
+    'apache-1.1': 'APACHE_1_1',
+}
+
+# opendatacommons.org / opendefinition.org licence path keys to EU codes
+_ODC_LICENCE_CODES = {
+    'pddl': 'ODC_PDDL',
+    'odbl': 'ODC_BL',
+    'by': 'ODC_BY',
+    'by-sa': 'ODC_BY',
+    'by-odbl': 'ODC_BL',
+}
+
+# opensource.org licence slugs to EU codes
+_OPENSOURCE_LICENCE_CODES = {
+    'mit': 'MIT',
+    'apache-2.0': 'APACHE_2_0',
+    'apache-1.1': 'APACHE_1_1',
+    'gpl-3.0': 'GPL_3_0',
+    'gpl-2.0': 'GPL_2_0',
+    'lgpl-3.0': 'LGPL_3_0',
+    'lgpl-2.1': 'LGPL_2_1',
+}
+
+_EU_PUBLICATIONS_HOST = 'publications.europa.eu'
+_EU_LICENCE_AUTHORITY_PATH = '/resource/authority/licence/'
+_EU_LICENCE_AUTHORITY_PREFIXES = (
+    'http://' + _EU_PUBLICATIONS_HOST + _EU_LICENCE_AUTHORITY_PATH,
+    'https://' + _EU_PUBLICATIONS_HOST + _EU_LICENCE_AUTHORITY_PATH,
+)
+
+
+def _creative_commons_licence_code(segments):
+    return CoreCkanHarvester._map_creative_commons_segments(segments)
+
+
+def _odc_licence_code(segments):
+    if len(segments) >= 2:
+        return _ODC_LICENCE_CODES.get(segments[1].lower())
+    return None
+
+
+def _gnu_licence_code(segments):
+    last = segments[-1].lower()
+    if 'fdl' in last:
+        return 'GFDL_1_3'
+    if 'gpl' in last:
+        return 'GPL_3_0'
+    return None
+
+
+def _opensource_licence_code(segments):
+    return _OPENSOURCE_LICENCE_CODES.get(segments[-1].lower())
+
+
+# Licence publisher domains to the handler mapping their URL path segments
+# to an EU licence code
+_LICENCE_HOST_HANDLERS = {
+    'creativecommons.org': _creative_commons_licence_code,
+    'opendatacommons.org': _odc_licence_code,
+    'opendefinition.org': _odc_licence_code,
+    'gnu.org': _gnu_licence_code,
+    'opensource.org': _opensource_licence_code,
+}
+
+# Harvest tracking extras and the harvest_object attribute path for each value
+_HARVEST_METADATA_FIELDS = (
+    ('harvest_object_id', ('id',)),
+    ('harvest_source_id', ('source', 'id')),
+    ('harvest_source_title', ('source', 'title')),
+    ('harvest_source_url', ('source', 'url')),
+)
+
+
+def _first_extra_value(extras, keys):
+    """
+    Return the first non-blank string value among ``extras`` whose key
+    (stripped, lowercased) is in ``keys``, or None.
+    """
+    return next(
+        (
+            extra['value'] for extra in extras
+            if isinstance(extra, dict)
+            and (extra.get('key') or '').strip().lower() in keys
+            and isinstance(extra.get('value'), str)
+            and extra['value'].strip()
+        ),
+        None
+    )
+
+
+def _extras_index(extras):
+    """
+    Map each key in a package ``extras`` list to its entry dict, so callers
+    can test membership and update entries without rescanning the list.
+    """
+    return {extra.get('key'): extra for extra in extras}
 
 
 class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
@@ -26,6 +234,14 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
     Custom CKAN Harvester for core CKAN datasets
     '''
     _licence_vocabulary_codes_cache = None
+    _license_register = None
+    _license_register_lock = threading.Lock()
+    _metadata_modified_stamp = None
+    _open_fallback_license_ids = None
+    _open_legislation = None
+    METADATA_MODIFIED_RESOLUTION = 1.0
+    # The legislation setting is editable at runtime, so it is only cached briefly
+    OPEN_LEGISLATION_CACHE_SECONDS = 60.0
 
     def __init__(self, name=None):
         super(CoreCkanHarvester, self).__init__(name)
@@ -53,22 +269,50 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
 
     def import_stage(self, harvest_object):
         log.info("Import stage started for object: %s", harvest_object.id)
+        # Parse the remote package once; modify_package_dict and the
+        # isopen override below reuse it
+        try:
+            harvest_object._parsed_content = json_loads(harvest_object.content)
+        except Exception:
+            harvest_object._parsed_content = None
         result = super(CoreCkanHarvester, self).import_stage(harvest_object)
 
         # Post-import isopen override - after all CKAN processing
         if result and hasattr(result, 'data') and result.data:
             try:
-                # Parse remote data again to check isopen
-                remote_package_dict = json.loads(harvest_object.content)
+                remote_package_dict = self._get_remote_package_dict(harvest_object)
                 if remote_package_dict.get('isopen') is True:
                     result.data['isopen'] = True
                     log.info("🔥🔥 FINAL isopen override in import_stage - forcing True")
             except Exception as e:
-                log.error(f"Error in post-import isopen override: {e}")
+                log.error("Error in post-import isopen override: %s", e)
 
         log.debug("Import stage completed with result: %s", result)
         return result
 
+    def _get_remote_package_dict(self, harvest_object):
+        """
+        Return the remote package parsed in import_stage, parsing it here
+        if it was not stashed on the harvest object.
+        """
+        remote_package_dict = getattr(harvest_object, '_parsed_content', None)
+        if remote_package_dict is None:
+            remote_package_dict = json_loads(harvest_object.content)
+        return remote_package_dict
+
+    @classmethod
+    def _get_metadata_modified_timestamp(cls):
+        """
+        Return the current UTC time in ISO format, reused for up to
+        METADATA_MODIFIED_RESOLUTION seconds across packages.
+        """
+        now = time.monotonic()
+        stamp = cls._metadata_modified_stamp
+        if stamp is None or now - stamp[0] >= cls.METADATA_MODIFIED_RESOLUTION:
+            stamp = (now, datetime.datetime.now(timezone.utc).isoformat())
+            cls._metadata_modified_stamp = stamp
+        return stamp[1]
+
     def modify_package_dict(self, package_dict, harvest_object):
         '''
         Modify the package dict to map the "name" field to tags and fix common mime types
@@ -83,34 +327,37 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         log.debug("Starting package modifications for: %s", package_dict.get('id', 'unknown'))
 
         # Force update by setting metadata_modified to now
-        package_dict['metadata_modified'] = datetime.datetime.now(timezone.utc).isoformat()
+        package_dict['metadata_modified'] = self._get_metadata_modified_timestamp()
 
         try:
             # Parse once at the beginning
             try:
-                remote_package_dict = json.loads(harvest_object.content)
+                remote_package_dict = self._get_remote_package_dict(harvest_object)
             except Exception as e:
-                log.error(f"Failed to parse harvest object content: {e}")
+                log.error("Failed to parse harvest object content: %s", e)
                 remote_package_dict = {}
 
             # Debug: Log remote package content to check for isopen
-            log.debug(f"Remote package keys: {list(remote_package_dict.keys())}")
-            log.debug(f"Remote isopen value: {remote_package_dict.get('isopen')}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Remote package keys: %s", list(remote_package_dict.keys()))
+            log.debug("Remote isopen value: %s", remote_package_dict.get('isopen'))
 
-            # Call the parent method first to filter extras
+            # Call the parent method first to filter extras. It is a single
+            # pass over the shared harvesting-keys whitelist, so it is kept
+            # rather than inlined here
             package_dict = super(CoreCkanHarvester, self).modify_package_dict(
                 package_dict, harvest_object
             )
 
             # Debug: Check if parent method kept isopen
-            log.debug(f"Package dict after parent method: {package_dict.get('isopen')}")
+            log.debug("Package dict after parent method: %s", package_dict.get('isopen'))
 
             # Get isopen from remote package if available
             remote_isopen = remote_package_dict.get('isopen')
-            log.debug(f"Getting isopen from remote: {remote_isopen}")
+            log.debug("Getting isopen from remote: %s", remote_isopen)
             if remote_isopen is not None:
                 package_dict['isopen'] = remote_isopen
-                log.debug(f"✅ Set isopen from remote package: {remote_isopen}")
+                log.debug("✅ Set isopen from remote package: %s", remote_isopen)
             else:
                 log.debug("❌ No isopen found in remote package")
 
@@ -134,7 +381,8 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
 
         except Exception as e:
             log.error(
-                f"Error modifying package dict for dataset {package_dict.get('id', 'unknown')}: {e}",
+                "Error modifying package dict for dataset %s: %s",
+                package_dict.get('id', 'unknown'), e,
                 exc_info=True
             )
             # Continue with partially modified package_dict rather than failing
@@ -143,167 +391,82 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         try:
             remote_isopen = remote_package_dict.get('isopen')
             license_id = package_dict.get('license_id')
-            log.info(f"License processing - remote isopen: {remote_isopen}, license_id: {license_id}")
-            
-            if remote_isopen is True and license_id:
-                # Map various license formats to their correct open equivalents in CKAN
-                license_mapping = {
-                    # Creative Commons variations (all versions)
-                    'CC-BY-4.0': 'cc-by', 'CC-BY-3.0': 'cc-by', 'CC-BY-2.5': 'cc-by', 'CC-BY-2.0': 'cc-by', 'CC-BY': 'cc-by',
-                    'CC-BY-SA-4.0': 'cc-by-sa', 'CC-BY-SA-3.0': 'cc-by-sa', 'CC-BY-SA-2.5': 'cc-by-sa', 'CC-BY-SA': 'cc-by-sa',
-                    'CC0': 'cc-zero', 'CC-0': 'cc-zero', 'CC0-1.0': 'cc-zero', 'CCZERO': 'cc-zero',
-                    # Open Data Commons variations (all formats)
-                    'ODC-BY': 'odc-by', 'ODC-ODbL': 'odc-odbl', 'ODC-PDDL': 'odc-pddl',
-                    'ODBL': 'odc-odbl', 'PDDL': 'odc-pddl', 'ODC-DBY': 'odc-by',
-                    'OPEN-DATA-COMMONS-BY': 'odc-by', 'OPEN-DATA-COMMONS-ODBL': 'odc-odbl', 'OPEN-DATA-COMMONS-PDDL': 'odc-pddl',
-                    # GNU variations
-                    'GFDL': 'gfdl', 'GNU-FDL': 'gfdl', 'GNU-FDL-1.3': 'gfdl',
-                    'GNU-FREE-DOCUMENTATION-LICENSE': 'gfdl',
-                    # Government and public sector licenses
-                    'UK-OGL': 'uk-ogl', 'OGL': 'uk-ogl', 'OPEN-GOVERNMENT': 'uk-ogl',
-                    'OPEN-GOVERNMENT-LICENCE': 'uk-ogl', 'UK-OPEN-GOVERNMENT-LICENCE': 'uk-ogl',
-                    # Generic open licenses
-                    'OTHER-OPEN': 'other-open', 'OTHER-PD': 'other-pd', 'OTHER-AT': 'other-at',
-                    'OPEN': 'other-open', 'PUBLIC-DOMAIN': 'other-pd', 'ATTRIBUTION': 'other-at',
-                    # European Union specific licenses
-                    'EU-ODBL': 'odc-odbl', 'EU-PDDL': 'odc-pddl', 'EU-BY': 'odc-by',
-                    # International variations
-                    'CREATIVE-COMMONS-ATTRIBUTION': 'cc-by', 'CREATIVE-COMMONS-ATTRIBUTION-SHARE-ALIKE': 'cc-by-sa',
-                    'CREATIVE-COMMONS-ZERO': 'cc-zero',
-                    # Non-Commercial variations (mapping to closed but tracking)
-                    'CC-BY-NC': 'cc-nc', 'CC-BY-NC-SA': 'cc-nc-sa', 'CREATIVE-COMMONS-NON-COMMERCIAL': 'cc-nc',
-                    # Other open license variations
-                    'OPENDATA-COMMONS-ATTRIBUTION': 'odc-by',
-                    'OPENDATA-COMMONS-OPEN-DATABASE-LICENSE': 'odc-odbl',
-                    'OPENDATA-COMMONS-PUBLIC-DOMAIN-DEDICATION': 'odc-pddl',
-                }
-                
-                # Try to find a mapped license (case insensitive)
-                mapped_license_id = None
-                try:
-                    for mapped_id, ckan_id in license_mapping.items():
-                        if license_id.upper() == mapped_id.upper():
-                            mapped_license_id = ckan_id
-                            break
-
-                    # If no mapping found, try to use original license_id
-                    if not mapped_license_id:
-                        mapped_license_id = license_id
-                        log.info(f"Using original license_id: {license_id} (no mapping found)")
-
-                    if mapped_license_id != license_id:
-                        package_dict['license_id'] = mapped_license_id
-                        log.info(f"🔥 MAPPED license {license_id} -> {mapped_license_id}")
-                except Exception as e:
-                    log.warning(f"Error mapping license {license_id}, using original: {e}")
+            if remote_isopen is not True or not license_id:
+                log.info("Not processing license - remote isopen: %s, license_id: %s", remote_isopen, license_id)
+                return package_dict
+
+            log.info("License processing - remote isopen: %s, license_id: %s", remote_isopen, license_id)
+
+            # Try to find a mapped license (case insensitive)
+            mapped_license_id = None
+            try:
+                mapped_license_id = _LICENSE_MAPPING.get(license_id.upper())
+
+                # If no mapping found, try to use original license_id
+                if not mapped_license_id:
                     mapped_license_id = license_id
+                    log.info("Using original license_id: %s (no mapping found)", license_id)
+
+                if mapped_license_id != license_id:
+                    package_dict['license_id'] = mapped_license_id
+                    log.info("🔥 MAPPED license %s -> %s", license_id, mapped_license_id)
+            except Exception as e:
+                log.warning("Error mapping license %s, using original: %s", license_id, e)
+                mapped_license_id = license_id
+            
+            # Ensure the license is marked as open in the license register
+            try:
+                license_obj = self._get_license(mapped_license_id)
+            except Exception as e:
+                log.warning("Error accessing license register: %s", e)
+                license_obj = None
+            
+            if license_obj:
+                # Check if license is already marked as open
+                current_isopen = license_obj.isopen() if hasattr(license_obj, 'isopen') else False
+                log.info("License %s is currently marked as open: %s", mapped_license_id, current_isopen)
                 
-                # Ensure the license is marked as open in the license register
-                try:
-                    from ckan.model.license import LicenseRegister
-                    licenses = LicenseRegister()
-                    license_obj = licenses.get(mapped_license_id)
-                except Exception as e:
-                    log.warning(f"Error accessing license register: {e}")
-                    license_obj = None
-                
-                if license_obj:
-                    # Check if license is already marked as open
-                    current_isopen = license_obj.isopen() if hasattr(license_obj, 'isopen') else False
-                    log.info(f"License {mapped_license_id} is currently marked as open: {current_isopen}")
+                # If license is not marked as open, force it to be open
+                if not current_isopen:
+                    # Check if this should be an open license based on common patterns
+                    license_title_lower = getattr(license_obj, 'title', '').lower()
+                    license_id_lower = mapped_license_id.lower()
                     
-                    # If license is not marked as open, force it to be open
-                    if not current_isopen:
-                        # Check if this should be an open license based on common patterns
-                        license_title = getattr(license_obj, 'title', '').lower()
-                        license_id_lower = mapped_license_id.lower()
-                        
-                        is_likely_open = (
-                            # CKAN open license IDs
-                            'cc-by' in license_id_lower or
-                            'cc-by-sa' in license_id_lower or
-                            'cc-zero' in license_id_lower or
-                            'odc-by' in license_id_lower or
-                            'odc-odbl' in license_id_lower or
-                            'odc-pddl' in license_id_lower or
-                            'gfdl' in license_id_lower or
-                            'uk-ogl' in license_id_lower or
-                            'other-open' in license_id_lower or
-                            'other-pd' in license_id_lower or
-                            'other-at' in license_id_lower or
-                            # Generic CC patterns
-                            'cc-' in license_id_lower or
-                            'creative commons' in license_title.lower() or
-                            # Open Data Commons patterns  
-                            'opendata commons' in license_title.lower() or
-                            'open data commons' in license_title.lower() or
-                            # Public domain patterns
-                            'public domain' in license_title.lower() or
-                            'domaine public' in license_title.lower() or
-                            # Government patterns
-                            'open government' in license_title.lower() or
-                            'government licence' in license_title.lower() or
-                            'government license' in license_title.lower() or
-                            'licence ouverte' in license_title.lower() or
-                            # GNU patterns
-                            'gnu free documentation' in license_title.lower() or
-                            'gnu fdl' in license_title.lower() or
-                            # Generic open patterns
-                            'open licence' in license_title.lower() or
-                            'open license' in license_title.lower() or
-                            'libre' in license_title.lower() or
-                            # European patterns
-                            'eu-odbl' in license_id_lower or
-                            'eu-pddl' in license_id_lower or
-                            'eu-by' in license_id_lower or
-                            # Zero patterns
-                            'cc0' in license_id_lower or
-                            'zero' in license_title.lower()
-                        )
-                        
-                        if is_likely_open:
-                            if hasattr(license_obj, 'od_conformance'):
-                                license_obj.od_conformance = 'approved'
-                            if hasattr(license_obj, 'osd_conformance'):
-                                license_obj.osd_conformance = 'approved'
-                            log.info(f"🔥 MARKED license {mapped_license_id} as OPEN by setting conformance to 'approved'")
-                        else:
-                            log.warning(f"License {mapped_license_id} doesn't appear to be an open license")
+                    is_likely_open = bool(
+                        _LIKELY_OPEN_ID_RE.search(license_id_lower) or
+                        _LIKELY_OPEN_TITLE_RE.search(license_title_lower)
+                    )
+                    
+                    if is_likely_open:
+                        if hasattr(license_obj, 'od_conformance'):
+                            license_obj.od_conformance = 'approved'
+                        if hasattr(license_obj, 'osd_conformance'):
+                            license_obj.osd_conformance = 'approved'
+                        log.info("🔥 MARKED license %s as OPEN by setting conformance to 'approved'", mapped_license_id)
                     else:
-                        log.info(f"License {mapped_license_id} is already properly marked as open")
+                        log.warning("License %s doesn't appear to be an open license", mapped_license_id)
                 else:
-                    log.warning(f"License {mapped_license_id} not found in license register")
-                    
-                    # Try to use a generic open license as fallback
-                    try:
-                        fallback_licenses = [
-                            # Creative Commons (most common)
-                            'cc-by', 'cc-by-sa', 'cc-zero',
-                            # Open Data Commons
-                            'odc-by', 'odc-odbl', 'odc-pddl',
-                            # Generic and other
-                            'other-open', 'other-pd', 'other-at',
-                            # GNU and Government
-                            'gfdl', 'uk-ogl'
-                        ]
-                        for fallback_id in fallback_licenses:
-                            fallback_obj = licenses.get(fallback_id)
-                            if fallback_obj and fallback_obj.isopen():
-                                package_dict['license_id'] = fallback_id
-                                log.info(f"🔥 FALLBACK: Using {fallback_id} instead of unknown license {license_id}")
-                                break
-                        else:
-                            log.warning(f"No suitable open license fallback found for {license_id}, keeping original")
-                    except Exception as e:
-                        log.warning(f"Error finding license fallback: {e}, keeping original license")
+                    log.info("License %s is already properly marked as open", mapped_license_id)
             else:
-                log.info(f"Not processing license - remote isopen: {remote_isopen}, license_id: {license_id}")
+                log.warning("License %s not found in license register", mapped_license_id)
                 
+                # Try to use a generic open license as fallback
+                try:
+                    open_fallback_ids = self._get_open_fallback_license_ids()
+                    if open_fallback_ids:
+                        fallback_id = open_fallback_ids[0]
+                        package_dict['license_id'] = fallback_id
+                        log.info("🔥 FALLBACK: Using %s instead of unknown license %s", fallback_id, license_id)
+                    else:
+                        log.warning("No suitable open license fallback found for %s, keeping original", license_id)
+                except Exception as e:
+                    log.warning("Error finding license fallback: %s, keeping original license", e)
+
         except NameError:
             # remote_package_dict not defined due to earlier parsing error
             log.error("❌ remote_package_dict not available for license processing")
         except Exception as e:
-            log.error(f"❌ Error in license processing: {e}", exc_info=True)
+            log.error("❌ Error in license processing: %s", e, exc_info=True)
         return package_dict
 
     def _fix_organization_mapping(self, package_dict, remote_package_dict):
@@ -314,10 +477,14 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if not remote_org:
                 return
 
-            publisher = {
-                'name': remote_org.get('title') or remote_org.get('name'),
-                'identifier': remote_org.get('id'),
-            }
+            # Only non-empty values are added to the publisher
+            publisher = {}
+            publisher_name = remote_org.get('title') or remote_org.get('name')
+            if publisher_name:
+                publisher['name'] = publisher_name
+            publisher_identifier = remote_org.get('id')
+            if publisher_identifier:
+                publisher['identifier'] = publisher_identifier
 
             remote_description = remote_org.get('description')
             if isinstance(remote_description, str) and remote_description.strip():
@@ -330,21 +497,11 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if not isinstance(extras, list):
                 extras = []
 
-            for extra in extras:
-                if not isinstance(extra, dict):
-                    continue
-                key = (extra.get('key') or '').strip().lower()
-                value = extra.get('value')
-                if not isinstance(value, str) or not value.strip():
-                    continue
-
-                if not remote_uri and key in {'uri', 'publisher_uri'}:
-                    remote_uri = value
-                if not remote_url and key in {'url', 'website', 'homepage', 'publisher_url'}:
-                    remote_url = value
-
-                if remote_uri and remote_url:
-                    break
+            if extras:
+                if not remote_uri:
+                    remote_uri = _first_extra_value(extras, _PUBLISHER_URI_KEYS)
+                if not remote_url:
+                    remote_url = _first_extra_value(extras, _PUBLISHER_URL_KEYS)
 
             if isinstance(remote_uri, str) and remote_uri.strip():
                 publisher['uri'] = remote_uri.strip()
@@ -352,15 +509,12 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if isinstance(remote_url, str) and remote_url.strip():
                 publisher['url'] = remote_url.strip()
 
-            # Remove empty values
-            publisher = {k: v for k, v in publisher.items() if v}
-
             if publisher:
                 package_dict['publisher'] = [publisher]
-                log.debug(f"Set publisher to: {publisher.get('name')}")
+                log.debug("Set publisher to: %s", publisher.get('name'))
 
         except Exception as e:
-            log.error(f"Error fixing organization mapping: {e}", exc_info=True)
+            log.error("Error fixing organization mapping: %s", e, exc_info=True)
 
     def _preserve_resource_names(self, package_dict, remote_package_dict):
         '''
@@ -372,33 +526,34 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             local_resources = package_dict.get('resources', [])
 
             for remote_resource, local_resource in zip(remote_resources, local_resources):
-                # Handle resource name from remote 'name' field
-                remote_name = remote_resource.get('name')
+                remote_get = remote_resource.get
+
+                # Handle resource name from remote 'name' field, falling back
+                # to the remote 'title' when there is no usable name
+                remote_name = remote_get('name')
                 if remote_name and isinstance(remote_name, str):
                     # Create translated name field
                     local_resource['name_translated'] = {'el': remote_name.strip()}
                     # Remove original name field when we have translated version
                     local_resource.pop('name', None)
-                    log.debug(f"Set name_translated for resource: {remote_name}")
+                    log.debug("Set name_translated for resource: %s", remote_name)
+                elif 'name_translated' not in local_resource:
+                    remote_title = remote_get('title')
+                    if remote_title and isinstance(remote_title, str):
+                        local_resource['name_translated'] = {'el': remote_title.strip()}
+                        log.debug("Used title as name_translated for resource: %s", remote_title)
 
                 # Handle resource description
-                remote_description = remote_resource.get('description')
+                remote_description = remote_get('description')
                 if remote_description and isinstance(remote_description, str):
                     # Create translated description field
                     local_resource['description_translated'] = {'el': remote_description.strip()}
                     # Remove original description field when we have translated version
                     local_resource.pop('description', None)
-                    log.debug(f"Set description_translated for resource")
-
-                # Handle resource title as fallback for name
-                remote_title = remote_resource.get('title')
-                if remote_title and isinstance(remote_title, str) and 'name_translated' not in local_resource:
-                    # Use title as name if name wasn't provided
-                    local_resource['name_translated'] = {'el': remote_title.strip()}
-                    log.debug(f"Used title as name_translated for resource: {remote_title}")
+                    log.debug("Set description_translated for resource")
 
         except Exception as e:
-            log.error(f"Error preserving resource names: {e}", exc_info=True)
+            log.error("Error preserving resource names: %s", e, exc_info=True)
 
     def _ensure_translated_field(self, package_dict, field_name, default_value):
         """Helper to ensure translated fields exist to avoid repetition"""
@@ -415,7 +570,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if not isinstance(value, str):
                 value = ''
             package_dict[translated_key] = value
-            log.debug(f"Set {translated_key}: {package_dict[translated_key]}")
+            log.debug("Set %s: %s", translated_key, package_dict[translated_key])
 
     def _fix_required_fields(self, package_dict):
         # Ensure title_translated-el exists
@@ -431,8 +586,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         Also removes any access_rights occurrences from extras to avoid conflicts.
         """
         try:
-            public_uri = 'http://publications.europa.eu/resource/authority/access-right/PUBLIC'
-            package_dict['access_rights'] = public_uri
+            package_dict['access_rights'] = _PUBLIC_ACCESS_RIGHTS_URI
 
             # Clean up potential duplicates in extras
             extras = package_dict.get('extras')
@@ -443,7 +597,24 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
                 ]
             log.debug("Set access_rights to PUBLIC for harvested dataset")
         except Exception as e:
-            log.error(f"Error setting access_rights to PUBLIC: {e}")
+            log.error("Error setting access_rights to PUBLIC: %s", e)
+
+    @classmethod
+    def _get_open_legislation(cls):
+        """
+        Return the stripped ``ckanext.data_gov_gr.dataset.legislation.open``
+        value ('' when unset or not a string), re-read at most every
+        OPEN_LEGISLATION_CACHE_SECONDS.
+        """
+        now = time.monotonic()
+        cached = cls._open_legislation
+        if cached is None or now - cached[0] >= cls.OPEN_LEGISLATION_CACHE_SECONDS:
+            value = data_gov_helpers.get_config_value(
+                'ckanext.data_gov_gr.dataset.legislation.open', ''
+            )
+            cached = (now, value.strip() if isinstance(value, str) else '')
+            cls._open_legislation = cached
+        return cached[1]
 
     def _ensure_applicable_legislation(self, package_dict):
         """
@@ -470,26 +641,16 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if not (lowered.endswith('/public') or 'access-right/public' in lowered):
                 return
 
-            value = data_gov_helpers.get_config_value(
-                'ckanext.data_gov_gr.dataset.legislation.open', ''
-            )
-            if not isinstance(value, str):
-                return
-
-            value = value.strip()
+            value = self._get_open_legislation()
             if not value:
                 return
 
             package_dict['applicable_legislation'] = [value]
         except Exception as e:
-            log.error(f"Error ensuring applicable_legislation for CKAN dataset: {e}")
+            log.error("Error ensuring applicable_legislation for CKAN dataset: %s", e)
 
     def _fix_common_mime_types(self, package_dict, remote_package_dict):
         '''Convert mime types to IANA URIs by adding the IANA prefix'''
-        mime_type_corrections = {
-            'txt/csv': 'text/csv',  # Fix common typo
-        }
-
         for i, resource in enumerate(package_dict.get('resources', [])):
             if not isinstance(resource, dict):
                 continue
@@ -498,25 +659,21 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             if not mimetype:
                 continue
 
-            try:
-                # Skip if already in IANA format
-                if mimetype.startswith('https://www.iana.org/assignments/media-types/'):
-                    continue
-
-                # Apply corrections
-                mimetype = mime_type_corrections.get(mimetype, mimetype)
-
-                # Convert to IANA URI format if it looks like a standard MIME type
-                if '/' in mimetype and not mimetype.startswith('http'):
-                    iana_uri = f'https://www.iana.org/assignments/media-types/{mimetype}'
-                    resource['mimetype'] = iana_uri
-                    log.debug(f"Converted mimetype for resource {i}: {mimetype} -> {iana_uri}")
-            except Exception as e:
-                log.warning(f"Failed to process mimetype for resource {i}, clearing mimetype and continuing: {e}")
-                # Set mimetype to None (empty) but continue processing
+            if not isinstance(mimetype, str):
+                log.warning("Failed to process mimetype for resource %s, clearing mimetype and continuing: %r", i, mimetype)
                 resource['mimetype'] = None
                 continue
 
+            # Skip URIs, including ones already in IANA format, and anything
+            # that does not look like a standard MIME type
+            if mimetype.startswith('http') or '/' not in mimetype:
+                continue
+
+            mimetype = _MIME_TYPE_CORRECTIONS.get(mimetype, mimetype)
+            iana_uri = _IANA_MEDIA_TYPES_PREFIX + mimetype
+            resource['mimetype'] = iana_uri
+            log.debug("Converted mimetype for resource %s: %s -> %s", i, mimetype, iana_uri)
+
     def _add_groups_as_tags(self, package_dict, remote_package_dict):
         '''Adds the titles of the groups from the remote package as tags'''
         try:
@@ -530,18 +687,23 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
 
             existing_tag_names = {tag.get('name') for tag in package_dict['tags']}
 
+            # Collect new titles first (insertion ordered, deduplicated) so the
+            # tag list is extended once
+            new_titles = {}
             for group in remote_groups:
-                try:
-                    group_title = group.get('title', '').strip()
-                    if group_title and group_title not in existing_tag_names:
-                        package_dict['tags'].append({'name': group_title})
-                        log.debug(f"Added group title as tag: {group_title}")
-                except Exception as e:
-                    log.warning(f"Error adding group as tag, skipping: {e}")
+                group_title = group.get('title') if isinstance(group, dict) else None
+                if not isinstance(group_title, str):
                     continue
+                group_title = group_title.strip()
+                if group_title and group_title not in existing_tag_names:
+                    new_titles[group_title] = None
+
+            if new_titles:
+                package_dict['tags'].extend({'name': title} for title in new_titles)
+                log.debug("Added group titles as tags: %s", list(new_titles))
 
         except Exception as e:
-            log.error(f"Error adding groups as tags: {e}", exc_info=True)
+            log.error("Error adding groups as tags: %s", e, exc_info=True)
 
     def _is_valid_tag_name(self, tag_name):
         '''
@@ -563,8 +725,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             return False
 
         # Check for invalid characters
-        invalid_chars = set('",\'')
-        if any(char in tag_name for char in invalid_chars):
+        if any(char in tag_name for char in _INVALID_TAG_CHARS):
             return False
 
         return True
@@ -581,31 +742,43 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
                 log.debug("No tags to clean")
                 return
             
+            tags = package_dict['tags']
+            cleaned_names = [
+                self._clean_single_tag(tag['name']) if isinstance(tag, dict) and 'name' in tag else None
+                for tag in tags
+            ]
+
             cleaned_tags = []
-            for tag in package_dict['tags']:
+            append_tag = cleaned_tags.append
+            seen_names = set()
+            for tag, cleaned_name in zip(tags, cleaned_names):
                 try:
                     if isinstance(tag, dict) and 'name' in tag:
                         original_name = tag['name']
-                        cleaned_name = self._clean_single_tag(original_name)
 
-                        # Only add tag if cleaning succeeded and result is not empty
+                        # Only add tag if cleaning succeeded and result is not empty;
+                        # names that clean to an already kept tag are dropped so
+                        # CKAN does not reject the package for duplicate tags
                         if cleaned_name:
-                            cleaned_tags.append({'name': cleaned_name})
+                            if cleaned_name in seen_names:
+                                continue
+                            seen_names.add(cleaned_name)
+                            append_tag({'name': cleaned_name})
                             if original_name != cleaned_name:
-                                log.info(f"Cleaned tag: '{original_name}' -> '{cleaned_name}'")
+                                log.info("Cleaned tag: '%s' -> '%s'", original_name, cleaned_name)
                         else:
-                            log.warning(f"Removed invalid tag: '{original_name}'")
+                            log.warning("Removed invalid tag: '%s'", original_name)
                     else:
-                        log.warning(f"Invalid tag format: {tag}")
+                        log.warning("Invalid tag format: %s", tag)
                 except Exception as e:
-                    log.warning(f"Error cleaning individual tag, skipping: {e}")
+                    log.warning("Error cleaning individual tag, skipping: %s", e)
                     continue
             
             package_dict['tags'] = cleaned_tags
-            log.info(f"Tags cleaned: {len(cleaned_tags)} valid tags remaining")
+            log.info("Tags cleaned: %s valid tags remaining", len(cleaned_tags))
             
         except Exception as e:
-            log.error(f"Error cleaning tags: {e}", exc_info=True)
+            log.error("Error cleaning tags: %s", e, exc_info=True)
 
     def _clean_single_tag(self, tag_name):
         '''
@@ -621,18 +794,10 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             return ''
         
         # Replace common problematic characters with valid alternatives
-        cleaned = tag_name.replace(':', '-')  # Replace colons with hyphens
-        cleaned = cleaned.replace('+', '-plus')  # Replace plus with -plus
-        cleaned = cleaned.replace('&', 'and')  # Replace ampersand with 'and'
-        cleaned = cleaned.replace('\'', '')  # Remove apostrophes
-        cleaned = cleaned.replace('"', '')  # Remove quotes
-        cleaned = cleaned.replace('«', '')  # Remove Greek opening quotes
-        cleaned = cleaned.replace('»', '')  # Remove Greek closing quotes
-        cleaned = cleaned.replace('(', '')  # Remove opening parentheses
-        cleaned = cleaned.replace(')', '')  # Remove closing parentheses
+        cleaned = tag_name.translate(_TAG_CHAR_REPLACEMENTS)
         
         # Keep only alphanumeric characters, spaces, hyphens, underscores, and dots
-        cleaned = ''.join(char for char in cleaned if char.isalnum() or char in ' -_.')
+        cleaned = _TAG_DISALLOWED_CHARS_RE.sub('', cleaned)
         
         # Remove multiple consecutive spaces and trim
         cleaned = ' '.join(cleaned.split())
@@ -641,7 +806,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         if len(cleaned) > MAX_TAG_LENGTH:
             original_length = len(cleaned)
             cleaned = cleaned[:MAX_TAG_LENGTH]  # Truncate to exact length
-            log.warning(f"Tag truncated from {original_length} to {MAX_TAG_LENGTH} characters: '{cleaned}'")
+            log.warning("Tag truncated from %s to %s characters: '%s'", original_length, MAX_TAG_LENGTH, cleaned)
         
         return cleaned.strip()
 
@@ -655,51 +820,32 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         '''
         try:
             # Ensure extras list exists
-            if 'extras' not in package_dict:
-                package_dict['extras'] = []
-            
-            # Check if harvest metadata already exists
-            existing_keys = {extra.get('key') for extra in package_dict['extras']}
-            
-            # Add harvest object ID
-            if 'harvest_object_id' not in existing_keys and harvest_object.id:
-                package_dict['extras'].append({
-                    'key': 'harvest_object_id',
-                    'value': harvest_object.id
-                })
-                log.debug(f"Added harvest_object_id: {harvest_object.id}")
-            
-            # Add harvest source ID from the harvest source configuration
-            harvest_source_id = harvest_object.source.id
-            if 'harvest_source_id' not in existing_keys and harvest_source_id:
-                package_dict['extras'].append({
-                    'key': 'harvest_source_id',
-                    'value': harvest_source_id
-                })
-                log.debug(f"Added harvest_source_id: {harvest_source_id}")
-            
-            # Add harvest source title
-            harvest_source_title = harvest_object.source.title
-            if 'harvest_source_title' not in existing_keys and harvest_source_title:
-                package_dict['extras'].append({
-                    'key': 'harvest_source_title',
-                    'value': harvest_source_title
-                })
-                log.debug(f"Added harvest_source_title: {harvest_source_title}")
-            
-            # Add harvest source URL
-            harvest_source_url = harvest_object.source.url
-            if 'harvest_source_url' not in existing_keys and harvest_source_url:
-                package_dict['extras'].append({
-                    'key': 'harvest_source_url',
-                    'value': harvest_source_url
-                })
-                log.debug(f"Added harvest_source_url: {harvest_source_url}")
-            
-            log.info(f"Added harvest metadata: {len([e for e in package_dict['extras'] if e.get('key') in ['harvest_object_id', 'harvest_source_id']])} harvest entries")
+            extras = package_dict.setdefault('extras', [])
+
+            # Check if harvest metadata already exists; the index is kept in
+            # step with the list so a repeated key is never appended twice
+            index = _extras_index(extras)
+
+            for key, attr_path in _HARVEST_METADATA_FIELDS:
+                if key in index:
+                    continue
+                value = harvest_object
+                for attr in attr_path:
+                    value = getattr(value, attr)
+                if value:
+                    entry = {'key': key, 'value': value}
+                    extras.append(entry)
+                    index[key] = entry
+                    log.debug("Added %s: %s", key, value)
+
+            if log.isEnabledFor(logging.INFO):
+                log.info("Added harvest metadata: %d harvest entries", sum(
+                    1 for e in package_dict['extras']
+                    if e.get('key') in ('harvest_object_id', 'harvest_source_id')
+                ))
             
         except Exception as e:
-            log.error(f"Error adding harvest metadata: {e}", exc_info=True)
+            log.error("Error adding harvest metadata: %s", e, exc_info=True)
 
 
     def _add_license_to_resources(self, package_dict):
@@ -717,7 +863,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         is_open = package_dict.get('isopen')
 
         # Skip if no license information available
-        if not any([license_id, license_title, license_url, is_open is not None]):
+        if not (license_id or license_title or license_url or is_open is not None):
             log.debug("No license information found in package")
             return
 
@@ -726,34 +872,37 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             log.debug("No resources found in package")
             return
 
+        # The mapping depends only on package-level fields, so resolve it once
+        try:
+            mapped_license_value = self._map_license_to_eu_uri(license_url, license_id)
+        except Exception as e:
+            log.warning("Failed to map license to EU authority URI: %s", e)
+            mapped_license_value = None
+
+        # Fields copied onto every resource, built once in the order they
+        # were previously assigned
+        resource_fields = {}
+        if license_id:
+            resource_fields['license_id'] = license_id
+        if license_title:
+            resource_fields['license_title'] = license_title
+        if license_url:
+            resource_fields['license_url'] = license_url
+        if mapped_license_value:
+            resource_fields['license'] = mapped_license_value
+        if is_open is not None:
+            resource_fields['is_open'] = is_open
+
         # Add license information to each resource
-        for i, resource in enumerate(resources):
-            if not isinstance(resource, dict):
-                continue
-                
-            try:
-                # Add license fields to resource
-                if license_id:
-                    resource['license_id'] = license_id
-                if license_title:
-                    resource['license_title'] = license_title
-                if license_url:
-                    resource['license_url'] = license_url
-
-                mapped_license_value = self._map_license_to_eu_uri(license_url, license_id)
-                if mapped_license_value:
-                    resource['license'] = mapped_license_value
-                elif license_url:
-                    log.debug(f"Resource {i}: license URL '{license_url}' could not be mapped to EU authority URI")
-
-                if is_open is not None:
-                    resource['is_open'] = is_open
-
-                log.debug(f"Added license info to resource {i}: {license_id or license_title} (open: {is_open}, mapped: {mapped_license_value})")
-            except Exception as e:
-                log.warning(f"Failed to process license for resource {i}, skipping license processing: {e}")
-                # Continue processing other resources even if license processing fails for this one
-                continue
+        updated = 0
+        for resource in resources:
+            if isinstance(resource, dict):
+                resource.update(resource_fields)
+                updated += 1
+
+        if not mapped_license_value and license_url:
+            log.debug("License URL '%s' could not be mapped to EU authority URI", license_url)
+        log.info("Applied license %s to %d resources (open: %s, mapped: %s)", license_id or license_title, updated, is_open, mapped_license_value)
 
     def _map_license_to_eu_uri(self, license_url, license_id):
         """
@@ -774,17 +923,54 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         code = code.upper()
         valid_codes = self._get_valid_licence_codes()
         if valid_codes and code not in valid_codes:
-            log.debug(f"License code '{code}' not present in Licence vocabulary, skipping mapping")
+            log.debug("License code '%s' not present in Licence vocabulary, skipping mapping", code)
             return None
 
         return f'http://publications.europa.eu/resource/authority/licence/{code}'
 
+    @classmethod
+    def _get_license_register(cls):
+        """
+        Return the shared LicenseRegister, building it on first use.
+        """
+        if cls._license_register is None:
+            with cls._license_register_lock:
+                if cls._license_register is None:
+                    from ckan.model.license import LicenseRegister
+                    cls._license_register = LicenseRegister()
+        return cls._license_register
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_license(license_id):
+        """
+        Look up a license in the shared register, memoized per license id.
+        """
+        return CoreCkanHarvester._get_license_register().get(license_id)
+
+    @classmethod
+    def _get_open_fallback_license_ids(cls):
+        """
+        Return the fallback license ids that the register marks as open,
+        in order of preference, computed once per process.
+        """
+        if cls._open_fallback_license_ids is None:
+            open_ids = []
+            for fallback_id in _FALLBACK_LICENSE_IDS:
+                fallback_obj = cls._get_license(fallback_id)
+                if fallback_obj and fallback_obj.isopen():
+                    open_ids.append(fallback_id)
+            cls._open_fallback_license_ids = open_ids
+        return cls._open_fallback_license_ids
+
     def _get_valid_licence_codes(self):
         """
-        Load and cache the set of valid licence codes from the Licence vocabulary.
+        Load and cache the frozenset of valid licence codes from the Licence
+        vocabulary.
         """
-        if CoreCkanHarvester._licence_vocabulary_codes_cache is not None:
-            return CoreCkanHarvester._licence_vocabulary_codes_cache
+        cached = CoreCkanHarvester._licence_vocabulary_codes_cache
+        if cached is not None:
+            return cached
 
         try:
             vocabulary = toolkit.get_action('vocabularyadmin_vocabulary_show')(
@@ -795,78 +981,65 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
             for tag in tags:
                 value_uri = tag.get('value_uri')
                 if value_uri and isinstance(value_uri, str):
-                    code = value_uri.rstrip('/').split('/')[-1].upper()
+                    code = value_uri.rstrip('/').rpartition('/')[2].upper()
                     codes.add(code)
                 elif tag.get('name'):
-                    code = tag['name'].rstrip('/').split('/')[-1].upper()
+                    code = tag['name'].rstrip('/').rpartition('/')[2].upper()
                     codes.add(code)
 
+            codes = frozenset(codes)
             CoreCkanHarvester._licence_vocabulary_codes_cache = codes
-            log.debug(f"Loaded {len(codes)} licence codes from vocabulary")
+            log.debug("Loaded %s licence codes from vocabulary", len(codes))
             return codes
         except Exception as e:
-            log.warning(f"Could not load Licence vocabulary codes: {e}")
-            CoreCkanHarvester._licence_vocabulary_codes_cache = set()
+            log.warning("Could not load Licence vocabulary codes: %s", e)
+            CoreCkanHarvester._licence_vocabulary_codes_cache = frozenset()
             return CoreCkanHarvester._licence_vocabulary_codes_cache
 
-    def _extract_license_code_from_url(self, license_url):
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _extract_license_code_from_url(license_url):
         """
         Attempt to derive the EU Publications licence code from a given URL.
+
+        Memoized per URL, since catalogues repeat a handful of licence URLs.
         """
         try:
             url = license_url.strip()
             if not url:
                 return None
 
-            lower_url = url.lower()
-            if 'publications.europa.eu/resource/authority/licence/' in lower_url:
-                return url.rstrip('/').split('/')[-1]
+            # Canonical EU authority URIs need no parsing at all
+            if url.lower().startswith(_EU_LICENCE_AUTHORITY_PREFIXES):
+                return url.rstrip('/').rpartition('/')[2]
 
             parsed = urlparse(url if '://' in url else f'https://{url}')
-            netloc = parsed.netloc.lower()
+            host = parsed.hostname or ''
+
+            # EU authority URIs already carry the licence code as their last segment
+            if (
+                (host == _EU_PUBLICATIONS_HOST or host.endswith('.' + _EU_PUBLICATIONS_HOST))
+                and parsed.path[:len(_EU_LICENCE_AUTHORITY_PATH)].lower() == _EU_LICENCE_AUTHORITY_PATH
+            ):
+                return url.rstrip('/').rpartition('/')[2]
+
             segments = [seg for seg in parsed.path.split('/') if seg]
+            if not segments:
+                return None
 
-            if 'creativecommons.org' in netloc and segments:
-                return self._map_creative_commons_segments(segments)
-
-            if ('opendatacommons.org' in netloc or 'opendefinition.org' in netloc) and len(segments) >= 2:
-                licence_key = segments[1].lower()
-                odc_mapping = {
-                    'pddl': 'ODC_PDDL',
-                    'odbl': 'ODC_BL',
-                    'by': 'ODC_BY',
-                    'by-sa': 'ODC_BY',
-                    'by-odbl': 'ODC_BL'
-                }
-                if licence_key in odc_mapping:
-                    return odc_mapping[licence_key]
-
-            if 'gnu.org' in netloc and segments:
-                if 'fdl' in segments[-1].lower():
-                    return 'GFDL_1_3'
-                if 'gpl' in segments[-1].lower():
-                    return 'GPL_3_0'
-
-            if 'opensource.org' in netloc and segments:
-                last = segments[-1].lower()
-                opensource_mapping = {
-                    'mit': 'MIT',
-                    'apache-2.0': 'APACHE_2_0',
-                    'apache-1.1': 'APACHE_1_1',
-                    'gpl-3.0': 'GPL_3_0',
-                    'gpl-2.0': 'GPL_2_0',
-                    'lgpl-3.0': 'LGPL_3_0',
-                    'lgpl-2.1': 'LGPL_2_1'
-                }
-                if last in opensource_mapping:
-                    return opensource_mapping[last]
+            # Dispatch on the registered domain (last two host labels), so
+            # www. and other subdomains route to the same handler
+            handler = _LICENCE_HOST_HANDLERS.get('.'.join(host.rsplit('.', 2)[-2:]))
+            if handler:
+                return handler(segments)
 
             return None
         except Exception as e:
-            log.debug(f"Failed to extract licence code from URL '{license_url}': {e}")
+            log.debug("Failed to extract licence code from URL '%s': %s", license_url, e)
             return None
 
-    def _map_creative_commons_segments(self, segments):
+    @staticmethod
+    def _map_creative_commons_segments(segments):
         """
         Map Creative Commons URL path segments to EU licence codes.
         """
@@ -883,7 +1056,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
                     if not extra.startswith('deed') and 'legalcode' not in extra:
                         territory = segments[3]
 
-                variant_code = ''.join(part.upper() for part in variant.split('-'))
+                variant_code = variant.replace('-', '').upper()
                 version_code = version.replace('.', '_').upper()
                 code = f'CC_{variant_code}'
                 if version_code:
@@ -906,7 +1079,7 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
 
             return None
         except Exception as e:
-            log.debug(f"Failed to map Creative Commons segments '{segments}': {e}")
+            log.debug("Failed to map Creative Commons segments '%s': %s", segments, e)
             return None
 
     def _normalize_license_id_to_code(self, license_id):
@@ -916,31 +1089,4 @@ class CoreCkanHarvester(DataGovGrHarvester, CKANHarvester):
         if not license_id:
             return None
 
-        normalized = license_id.strip().lower()
-        mapping = {
-            'cc-by': 'CC_BY_4_0',
-            'cc-by-sa': 'CC_BYSA_4_0',
-            'cc-by-nd': 'CC_BYND_4_0',
-            'cc-by-nc': 'CC_BYNC_4_0',
-            'cc-by-nc-sa': 'CC_BYNCSA_4_0',
-            'cc-by-nc-nd': 'CC_BYNCND_4_0',
-            'cc-zero': 'CC0',
-            'cc0': 'CC0',
-            'cc-nc': 'CC_BYNC_4_0',
-            'odc-odbl': 'ODC_BL',
-            'odc-pddl': 'ODC_PDDL',
-            'odc-by': 'ODC_BY',
-            'gfdl': 'GFDL_1_3',
-            'gpl': 'GPL_3_0',
-            'gpl-3.0': 'GPL_3_0',
-            'gpl-2.0': 'GPL_2_0',
-            'lgpl': 'LGPL_3_0',
-            'lgpl-3.0': 'LGPL_3_0',
-            'lgpl-2.1': 'LGPL_2_1',
-            'mit': 'MIT',
-            'apache': 'APACHE_2_0',
-            'apache-2.0': 'APACHE_2_0',
-            'apache-1.1': 'APACHE_1_1'
-        }
-
-        return mapping.get(normalized)
+        return _LICENSE_ID_CODES.get(license_id.strip().lower())
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 
+import bisect
+import copy
+import functools
 import logging
 import json
+import re
 from typing import Optional
 from ckan import model
 from ckanext.dcat.harvesters.rdf import DCATRDFHarvester
@@ -9,18 +13,100 @@ from ckanext.harvest.interfaces import IHarvester
 import ckan.plugins as plugins
 import ckan.plugins.toolkit as toolkit
 from ckanext.data_gov_gr import helpers as data_gov_helpers
+from ckanext.data_gov_gr.harvesters.base import json_loads
 
 log = logging.getLogger(__name__)
 
 # Cache for vocabulary data to avoid repeated database queries
 _vocabulary_cache = {}
 
+# Lowercased vocabulary names and aliases -> vocabulary id in the database
+_VOCABULARY_ALIASES = {
+    'access right': 'Access right',
+    'access rights': 'Access right',
+    'data theme': 'Data theme',
+    'dataset type': 'Dataset type',
+    'frequency': 'Frequency',
+    'high-value dataset categories': 'High-value dataset categories',
+    'language': 'Languages',
+    'languages': 'Languages',
+    'licence': 'Licence',
+    'license': 'Licence',
+    'media type': 'Media types',
+    'media types': 'Media types',
+    'mimetype': 'Media types',
+    'planned availability': 'Planned availability',
+    'publisher type': 'Publisher type',
+    'file type': 'File Type',
+    'file type - non proprietary format': 'File Type - Non Proprietary Format',
+    'machine readable file format': 'Machine Readable File Format',
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_vocabulary_name(vocabulary_name):
+    """
+    Vocabulary id in the database for a vocabulary name or alias; the
+    handful of names used by the field fixers resolve once per process.
+    """
+    return _VOCABULARY_ALIASES.get(vocabulary_name.lower(), vocabulary_name)
+
+
+# Tag characters replaced before the alphanumeric filter: parentheses become
+# hyphens, quotes and apostrophes are removed
+_TAG_CHAR_REPLACEMENTS = str.maketrans({'(': '-', ')': '-', '"': '', "'": ''})
+
+
+def _candidate_identifiers(candidate):
+    """
+    Identifiers of a JSON catalog dataset entry as strings (identifier, id
+    or @id; a single value or a list).
+    """
+    if not isinstance(candidate, dict):
+        return []
+    ident = candidate.get('identifier') or candidate.get('id') or candidate.get('@id')
+    if isinstance(ident, list):
+        return [str(v) for v in ident]
+    if ident is not None:
+        return [str(ident)]
+    return []
+
+
+@functools.lru_cache(maxsize=4096)
+def _identifier_code(value):
+    """
+    Code for a non-empty identifier string, memoized since the same
+    authority URIs recur across datasets and vocabulary loads.
+    """
+    trimmed = value.strip()
+    if not trimmed:
+        return ''
+
+    lowered = trimmed.lower()
+    if 'media-types/' in lowered:
+        return trimmed.split('media-types/', 1)[-1].strip('/').strip()
+
+    if trimmed.startswith('http://') or trimmed.startswith('https://'):
+        return trimmed.rstrip('/').split('/')[-1]
+
+    return trimmed
+
+
+# Characters dropped from tag names; \w is exactly str.isalnum() plus '_' for
+# str patterns, so Greek tags survive unchanged
+_TAG_DISALLOWED_CHARS_RE = re.compile(r'[^\w .-]')
+
 class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
     """
     Custom DCAT harvester for harvesting from data.gov.ie to data.gov.gr
     that fixes validation errors through custom mapping.
     """
 
+    # (job id, content, (datasets, index)) of the most recent JSON catalog.
+    # Replaced as a whole, so a harvester shared between threads never sees
+    # a half-updated entry, and dropped as soon as another job comes in.
+    _catalog_cache = None
+
     def _get_vocabulary_valid_codes(self, vocabulary_name):
         """
         Get valid codes from a controlled vocabulary in the database.
@@ -35,29 +121,35 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         if not vocabulary_name:
             return set()
 
-        alias_map = {
-            'access right': 'Access right',
-            'access rights': 'Access right',
-            'data theme': 'Data theme',
-            'dataset type': 'Dataset type',
-            'frequency': 'Frequency',
-            'high-value dataset categories': 'High-value dataset categories',
-            'language': 'Languages',
-            'languages': 'Languages',
-            'licence': 'Licence',
-            'license': 'Licence',
-            'media type': 'Media types',
-            'media types': 'Media types',
-            'mimetype': 'Media types',
-            'planned availability': 'Planned availability',
-            'publisher type': 'Publisher type',
-            'file type': 'File Type',
-            'file type - non proprietary format': 'File Type - Non Proprietary Format',
-            'machine readable file format': 'Machine Readable File Format'
-        }
+        lookup_name = _resolve_vocabulary_name(vocabulary_name)
+        return self._load_vocabulary(lookup_name)[0]
 
-        lookup_name = alias_map.get(vocabulary_name.lower(), vocabulary_name)
-        cache_key = f'valid_codes_{lookup_name}'
+    def _get_vocabulary_uri_map(self, vocabulary_name):
+        """
+        Return mapping CODE -> value (value_uri or name) for a controlled vocabulary.
+
+        This uses the same alias resolution as _get_vocabulary_valid_codes and
+        ensures that we always return the exact values that the scheming field
+        expects for a given vocabulary entry.
+        """
+        if not vocabulary_name:
+            return {}
+
+        lookup_name = _resolve_vocabulary_name(vocabulary_name)
+        return self._load_vocabulary(lookup_name)[1]
+
+    def _load_vocabulary(self, lookup_name):
+        """
+        Load a controlled vocabulary once and derive both its valid codes and
+        its CODE -> value map from a single pass over the tags.
+
+        Args:
+            lookup_name: Vocabulary id in the database (aliases already resolved)
+
+        Returns:
+            Tuple of (set of valid uppercase codes, dict CODE -> value_uri or name)
+        """
+        cache_key = f'vocabulary_{lookup_name}'
 
         if cache_key in _vocabulary_cache:
             return _vocabulary_cache[cache_key]
@@ -68,87 +160,43 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             )
             tags = vocabulary_data.get('tags', [])
 
-            # Extract codes from the vocabulary tags
             valid_codes = set()
+            mapping = {}
             for tag in tags:
-                # Try to get the code from value_uri or name
-                if tag.get('value_uri'):
-                    code = self._extract_code_from_identifier(tag['value_uri'])
-                    if code:
-                        valid_codes.add(code.upper())
-                elif tag.get('name'):
-                    code = self._extract_code_from_identifier(tag['name'])
-                    if code:
-                        valid_codes.add(code.upper())
-
-            # Cache the result
-            _vocabulary_cache[cache_key] = valid_codes
-            log.debug(f"Loaded {len(valid_codes)} valid codes for vocabulary '{lookup_name}'")
+                if not isinstance(tag, dict):
+                    continue
+                value_uri = tag.get('value_uri')
+                name = tag.get('name')
 
-            return valid_codes
+                # Valid codes come from value_uri when present, else from name;
+                # the map falls back to name when value_uri yields no code
+                uri_code = self._extract_code_from_identifier(value_uri) if value_uri else ''
+                name_code = ''
+                if name and not uri_code:
+                    name_code = self._extract_code_from_identifier(name)
 
-        except toolkit.ObjectNotFound:
-            log.warning(f"Vocabulary '{lookup_name}' not found in database")
-            return set()
-        except Exception as e:
-            log.error(f"Error loading vocabulary '{vocabulary_name}': {e}", exc_info=True)
-            return set()
-
-    def _get_vocabulary_uri_map(self, vocabulary_name):
-        """
-        Return mapping CODE -> value (value_uri or name) for a controlled vocabulary.
+                if value_uri:
+                    if uri_code:
+                        valid_codes.add(uri_code.upper())
+                elif name_code:
+                    valid_codes.add(name_code.upper())
 
-        This uses the same alias resolution as _get_vocabulary_valid_codes and
-        ensures that we always return the exact values that the scheming field
-        expects for a given vocabulary entry.
-        """
-        if not vocabulary_name:
-            return {}
+                code = uri_code or name_code
+                if code:
+                    mapping[code.upper()] = value_uri or name
 
-        alias_map = {
-            'access right': 'Access right',
-            'access rights': 'Access right',
-            'data theme': 'Data theme',
-            'dataset type': 'Dataset type',
-            'frequency': 'Frequency',
-            'high-value dataset categories': 'High-value dataset categories',
-            'language': 'Languages',
-            'languages': 'Languages',
-            'licence': 'Licence',
-            'license': 'Licence',
-            'media type': 'Media types',
-            'media types': 'Media types',
-            'mimetype': 'Media types',
-            'planned availability': 'Planned availability',
-            'publisher type': 'Publisher type',
-            'file type': 'File Type',
-            'file type - non proprietary format': 'File Type - Non Proprietary Format',
-            'machine readable file format': 'Machine Readable File Format',
-        }
+            # Cache the result
+            _vocabulary_cache[cache_key] = (valid_codes, mapping)
+            log.debug("Loaded %s valid codes for vocabulary '%s'", len(valid_codes), lookup_name)
 
-        lookup_name = alias_map.get(vocabulary_name.lower(), vocabulary_name)
-        try:
-            data = toolkit.get_action('vocabularyadmin_vocabulary_show')({}, {'id': lookup_name})
-            tags = data.get('tags', [])
-        except Exception:
-            log.warning(f"Could not load vocabulary '{lookup_name}' for URI map")
-            return {}
+            return valid_codes, mapping
 
-        mapping = {}
-        for tag in tags:
-            if not isinstance(tag, dict):
-                continue
-            value_uri = tag.get('value_uri')
-            name = tag.get('name')
-            code = ''
-            if value_uri:
-                code = self._extract_code_from_identifier(value_uri)
-            if not code and name:
-                code = self._extract_code_from_identifier(name)
-            if code:
-                mapping[code.upper()] = value_uri or name
-
-        return mapping
+        except toolkit.ObjectNotFound:
+            log.warning("Vocabulary '%s' not found in database", lookup_name)
+            return set(), {}
+        except Exception as e:
+            log.error("Error loading vocabulary '%s': %s", lookup_name, e, exc_info=True)
+            return set(), {}
 
     def _extract_code_from_identifier(self, value):
         """
@@ -157,18 +205,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         if not value or not isinstance(value, str):
             return ''
 
-        trimmed = value.strip()
-        if not trimmed:
-            return ''
-
-        lowered = trimmed.lower()
-        if 'media-types/' in lowered:
-            return trimmed.split('media-types/', 1)[-1].strip('/').strip()
-
-        if trimmed.startswith('http://') or trimmed.startswith('https://'):
-            return trimmed.rstrip('/').split('/')[-1]
-
-        return trimmed
+        return _identifier_code(value)
 
     def info(self):
         return {
@@ -184,8 +221,8 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         Apply custom mapping fixes to resolve validation errors
         """
         try:
-            log.info(f"[DATA.GOV.GR HARVESTER] Applying custom mapping to dataset: {package_dict.get('name', 'unknown')}")
-            log.info(f"[DATA.GOV.GR HARVESTER] Original frequency value: {package_dict.get('frequency', 'NOT SET')}")
+            log.info("[DATA.GOV.GR HARVESTER] Applying custom mapping to dataset: %s", package_dict.get('name', 'unknown'))
+            log.info("[DATA.GOV.GR HARVESTER] Original frequency value: %s", package_dict.get('frequency', 'NOT SET'))
 
             # Owner org is provided by each specific harvester (eg EKAN); no changes here
 
@@ -220,7 +257,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             # Fix 5.2: Handle language field using controlled vocabulary
             self._fix_language_field(package_dict)
 
-            log.info(f"[DATA.GOV.GR HARVESTER] After authority URI fixes: frequency={package_dict.get('frequency', 'NOT SET')}")
+            log.info("[DATA.GOV.GR HARVESTER] After authority URI fixes: frequency=%s", package_dict.get('frequency', 'NOT SET'))
 
             # Fix 6: Ensure required translated fields exist for data.gov.gr
             self._fix_required_translated_fields(package_dict)
@@ -251,10 +288,10 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             # Ensure access_rights and applicable_legislation for PUBLIC datasets
             self._ensure_access_rights_and_legislation(package_dict, source_data)
 
-            log.info(f"Custom mapping applied to dataset: {package_dict.get('name', 'unknown')}")
+            log.info("Custom mapping applied to dataset: %s", package_dict.get('name', 'unknown'))
 
         except Exception as e:
-            log.error(f"Error applying custom mapping: {e}", exc_info=True)
+            log.error("Error applying custom mapping: %s", e, exc_info=True)
 
         return package_dict
 
@@ -273,44 +310,82 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         if not harvest_object or not hasattr(harvest_object, 'content') or not harvest_object.content:
             return {}
 
-        try:
-            raw = json.loads(harvest_object.content)
-        except (json.JSONDecodeError, AttributeError):
-            # Non-JSON content (eg RDF/XML, Turtle), nothing to extract
-            log.debug("Harvest object content is not JSON; skipping source data extraction")
-            return {}
-
+        content = harvest_object.content
         guid = getattr(harvest_object, 'guid', None)
-
-        # If this looks like a DCAT/POD catalog, drill down to the dataset
-        # that matches this harvest object's guid.
-        if isinstance(raw, dict):
+        job_id = getattr(harvest_object, 'job_id', None)
+
+        # Every harvest object of a catalog source carries the same catalog,
+        # so it is parsed and indexed once per job and reused for the
+        # following objects
+        catalog = None
+        cached = self._catalog_cache
+        if guid and cached and cached[0] == job_id and cached[1] == content:
+            catalog = cached[2]
+        if catalog is None:
+            try:
+                raw = json_loads(content)
+            except (json.JSONDecodeError, AttributeError):
+                # Non-JSON content (eg RDF/XML, Turtle), nothing to extract
+                log.debug("Harvest object content is not JSON; skipping source data extraction")
+                return {}
+
+            # If this looks like a DCAT/POD catalog, drill down to the dataset
+            # that matches this harvest object's guid.
             datasets = None
-            if isinstance(raw.get('dataset'), list):
-                datasets = raw.get('dataset')
-            elif isinstance(raw.get('@graph'), list):
-                # Some JSON-LD feeds use @graph instead of dataset[]
-                datasets = raw.get('@graph')
-
-            if datasets and guid:
-                for candidate in datasets:
-                    if not isinstance(candidate, dict):
-                        continue
-                    ident = candidate.get('identifier') or candidate.get('id') or candidate.get('@id')
+            if isinstance(raw, dict):
+                if isinstance(raw.get('dataset'), list):
+                    datasets = raw.get('dataset')
+                elif isinstance(raw.get('@graph'), list):
+                    # Some JSON-LD feeds use @graph instead of dataset[]
+                    datasets = raw.get('@graph')
+
+            if not (datasets and guid):
+                # Fallback: return the raw JSON (may still be useful for helpers)
+                return raw
 
-                    identifiers = []
-                    if isinstance(ident, list):
-                        identifiers = [str(v) for v in ident]
-                    elif ident is not None:
-                        identifiers = [str(ident)]
+            catalog = (datasets, self._build_catalog_index(datasets))
+            self._catalog_cache = (job_id, content, catalog)
 
-                    for value in identifiers:
-                        # Match exact identifier or URIs that end with it
-                        if value == guid or (value.endswith(guid) and guid):
-                            return candidate
+        datasets, index = catalog
 
-        # Fallback: return the raw JSON (may still be useful for helpers)
-        return raw
+        # Like a scan of the catalog, the first dataset with an identifier
+        # equal to or ending with the guid wins
+        position = self._find_catalog_position(index, guid)
+
+        # The cached catalog is shared across harvest objects, so callers
+        # get their own copy
+        if position is not None:
+            return copy.deepcopy(datasets[position])
+        return json_loads(content)
+
+    def _build_catalog_index(self, datasets):
+        """
+        Return the identifiers of a JSON catalog as sorted
+        (reversed identifier, position in ``datasets``) pairs.
+
+        Reversed, the identifiers that end with a given guid share a prefix
+        and so form one contiguous run (see _find_catalog_position).
+        """
+        return sorted(
+            (value[::-1], position)
+            for position, candidate in enumerate(datasets)
+            for value in _candidate_identifiers(candidate)
+        )
+
+    def _find_catalog_position(self, index, guid):
+        """
+        Position of the first dataset with an identifier that equals or
+        ends with ``guid``, or None.
+        """
+        reversed_guid = guid[::-1]
+        position = None
+        for i in range(bisect.bisect_left(index, (reversed_guid,)), len(index)):
+            value, candidate_position = index[i]
+            if not value.startswith(reversed_guid):
+                break
+            if position is None or candidate_position < position:
+                position = candidate_position
+        return position
 
     def _ensure_access_rights_and_legislation(self, dataset_dict, source_data):
         """
@@ -379,7 +454,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                         if value:
                             dataset_dict['applicable_legislation'] = [value]
         except Exception as e:
-            log.error(f"Error ensuring access_rights/applicable_legislation: {e}", exc_info=True)
+            log.error("Error ensuring access_rights/applicable_legislation: %s", e, exc_info=True)
 
     def _preserve_license_information(self, dataset_dict, source_data):
         """
@@ -420,10 +495,18 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             if not coords:
                 continue
 
-            xs = [x for x, _ in coords]
-            ys = [y for _, y in coords]
-            minx, maxx = min(xs), max(xs)
-            miny, maxy = min(ys), max(ys)
+            # Envelope in a single pass over the points
+            minx = maxx = coords[0][0]
+            miny = maxy = coords[0][1]
+            for x, y in coords:
+                if x < minx:
+                    minx = x
+                elif x > maxx:
+                    maxx = x
+                if y < miny:
+                    miny = y
+                elif y > maxy:
+                    maxy = y
 
             bbox = {
                 "type": "Polygon",
@@ -450,16 +533,16 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                 item['centroid'] = json.dumps(centroid, ensure_ascii=False)
                 # Preserve original WKT as geom and use a friendly label
                 item['geom'] = text.strip()
-                if text.strip().upper().startswith('POLYGON'):
+                if item['geom'][:7].upper() == 'POLYGON':
                     item['text'] = 'Γεωγραφική περιοχή'
             except Exception as e:
-                log.warning(f"Error normalising spatial_coverage: {e}")
+                log.warning("Error normalising spatial_coverage: %s", e)
 
     def _parse_wkt_polygon(self, wkt_text):
         if not wkt_text or not isinstance(wkt_text, str):
             return None
         s = wkt_text.strip()
-        if not s.upper().startswith('POLYGON'):
+        if s[:7].upper() != 'POLYGON':
             return None
         try:
             start = s.find('((')
@@ -469,9 +552,6 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             inner = s[start + 2 : end]
             coords = []
             for part in inner.split(','):
-                part = part.strip()
-                if not part:
-                    continue
                 tokens = part.split()
                 if len(tokens) < 2:
                     continue
@@ -481,11 +561,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             return coords or None
         except Exception:
             return None
-            log.debug(f"Preserved license_id from source: {source_data['license_id']}")
+            log.debug("Preserved license_id from source: %s", source_data['license_id'])
 
         if source_data.get('license_title'):
             dataset_dict['license_title'] = source_data['license_title']
-            log.debug(f"Preserved license_title from source: {source_data['license_title']}")
+            log.debug("Preserved license_title from source: %s", source_data['license_title'])
 
         if source_data.get('license_url'):
             dataset_dict['license_url'] = source_data['license_url']
@@ -517,14 +597,15 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         for field in contact_fields:
             if source_data.get(field):
                 dataset_dict[field] = source_data[field]
-                log.debug(f"Preserved {field}: {source_data[field]}")
+                log.debug("Preserved %s: %s", field, source_data[field])
 
+        # Index the existing keys once instead of rescanning extras per field
         extras = dataset_dict.setdefault('extras', [])
+        existing_keys = {e.get('key') for e in extras}
         for field in contact_fields:
-            if source_data.get(field):
-                existing_extra = next((e for e in extras if e.get('key') == field), None)
-                if not existing_extra:
-                    extras.append({'key': field, 'value': source_data[field]})
+            if source_data.get(field) and field not in existing_keys:
+                extras.append({'key': field, 'value': source_data[field]})
+                existing_keys.add(field)
 
     def _fix_multilingual_fields(self, dataset_dict):
         """
@@ -587,14 +668,14 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     hvd_array = json.loads(hvd_value)
                     if isinstance(hvd_array, list) and hvd_array:
                         dataset_dict['hvd_category'] = hvd_array
-                        log.debug(f"Parsed HVD category JSON array: {len(hvd_array)} items")
+                        log.debug("Parsed HVD category JSON array: %s items", len(hvd_array))
                 except (json.JSONDecodeError, IndexError):
                     # If parsing fails, remove the field
                     del dataset_dict['hvd_category']
-                    log.warning(f"Failed to parse HVD category JSON: {hvd_value}")
+                    log.warning("Failed to parse HVD category JSON: %s", hvd_value)
             elif isinstance(hvd_value, list):
                 # Already an array - keep it
-                log.debug(f"HVD category is already an array: {len(hvd_value)} items")
+                log.debug("HVD category is already an array: %s items", len(hvd_value))
 
         # Handle dcat_type - keep as array
         if 'dcat_type' in dataset_dict:
@@ -605,14 +686,14 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     dcat_type_array = json.loads(dcat_type_value)
                     if isinstance(dcat_type_array, list) and dcat_type_array:
                         dataset_dict['dcat_type'] = dcat_type_array
-                        log.debug(f"Parsed dcat_type JSON array: {len(dcat_type_array)} items")
+                        log.debug("Parsed dcat_type JSON array: %s items", len(dcat_type_array))
                 except (json.JSONDecodeError, IndexError):
                     # If parsing fails, remove the field
                     del dataset_dict['dcat_type']
-                    log.warning(f"Failed to parse dcat_type JSON: {dcat_type_value}")
+                    log.warning("Failed to parse dcat_type JSON: %s", dcat_type_value)
             elif isinstance(dcat_type_value, list):
                 # Already an array - keep it
-                log.debug(f"dcat_type is already an array: {len(dcat_type_value)} items")
+                log.debug("dcat_type is already an array: %s items", len(dcat_type_value))
 
     def _fix_hvd_category(self, dataset_dict):
         """
@@ -630,11 +711,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     if isinstance(uri, str) and 'data.europa.eu/bna/' in uri:
                         cleaned_hvd.append(uri)
                     else:
-                        log.warning(f"Invalid HVD category URI: {uri}")
+                        log.warning("Invalid HVD category URI: %s", uri)
 
                 if cleaned_hvd:
                     dataset_dict['hvd_category'] = cleaned_hvd
-                    log.debug(f"HVD category array validated: {len(cleaned_hvd)} valid URIs")
+                    log.debug("HVD category array validated: %s valid URIs", len(cleaned_hvd))
                 else:
                     del dataset_dict['hvd_category']
                     log.warning("No valid HVD category URIs found, removing field")
@@ -648,7 +729,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                         cleaned_hvd = [uri for uri in hvd_array if isinstance(uri, str) and 'data.europa.eu/bna/' in uri]
                         if cleaned_hvd:
                             dataset_dict['hvd_category'] = cleaned_hvd
-                            log.debug(f"Fixed HVD category from JSON array: {len(cleaned_hvd)} valid URIs")
+                            log.debug("Fixed HVD category from JSON array: %s valid URIs", len(cleaned_hvd))
                         else:
                             del dataset_dict['hvd_category']
                 except (json.JSONDecodeError, IndexError):
@@ -656,11 +737,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     if 'data.europa.eu/bna/' in hvd_value:
                         # Convert single URI to array
                         dataset_dict['hvd_category'] = [hvd_value]
-                        log.debug(f"Converted single HVD category URI to array: {hvd_value}")
+                        log.debug("Converted single HVD category URI to array: %s", hvd_value)
                     else:
                         # If parsing fails and not valid URI, remove the field
                         del dataset_dict['hvd_category']
-                        log.warning(f"Removed invalid HVD category: {hvd_value}")
+                        log.warning("Removed invalid HVD category: %s", hvd_value)
 
         # Also check for HVD category in extras
         for extra in dataset_dict.get('extras', []):
@@ -672,16 +753,16 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                         hvd_array = json.loads(hvd_value)
                         if isinstance(hvd_array, list) and hvd_array:
                             extra['value'] = hvd_array
-                            log.debug(f"Fixed HVD category from extras JSON array: {len(hvd_array)} items")
+                            log.debug("Fixed HVD category from extras JSON array: %s items", len(hvd_array))
                     except (json.JSONDecodeError, IndexError):
                         # If not JSON, check if it's a single authority URI
                         if 'data.europa.eu/bna/' in hvd_value:
                             extra['value'] = [hvd_value]
-                            log.debug(f"Converted single HVD category in extras to array")
+                            log.debug("Converted single HVD category in extras to array")
                         else:
                             # If parsing fails and not valid URI, remove this extra
                             dataset_dict['extras'].remove(extra)
-                            log.warning(f"Removed invalid HVD category from extras: {hvd_value}")
+                            log.warning("Removed invalid HVD category from extras: %s", hvd_value)
                 break
 
     def _fix_theme_fields(self, dataset_dict):
@@ -711,15 +792,15 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                                     extra['value'] = first_theme
                             else:
                                 extra['value'] = str(first_theme)
-                            log.debug(f"Fixed theme from extras: {theme_value} -> {extra['value']}")
+                            log.debug("Fixed theme from extras: %s -> %s", theme_value, extra['value'])
                     except (json.JSONDecodeError, IndexError):
                         # If not JSON, check if it's already a valid authority URI
                         if 'authority/data-theme/' in theme_value:
-                            log.debug(f"Theme in extras is already a valid authority URI: {theme_value}")
+                            log.debug("Theme in extras is already a valid authority URI: %s", theme_value)
                         else:
                             # If parsing fails and not valid URI, remove this extra
                             dataset_dict['extras'].remove(extra)
-                            log.debug(f"Removed invalid theme from extras: {theme_value}")
+                            log.debug("Removed invalid theme from extras: %s", theme_value)
                 break
 
         # Also check for theme in main dataset fields
@@ -738,7 +819,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
 
                 if cleaned_themes:
                     dataset_dict['theme'] = cleaned_themes
-                    log.debug(f"Theme is array, keeping all {len(cleaned_themes)} authority URIs")
+                    log.debug("Theme is array, keeping all %s authority URIs", len(cleaned_themes))
                 else:
                     # Fallback to first theme if cleaning failed
                     dataset_dict['theme'] = [theme_value[0]]
@@ -761,11 +842,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                                 dataset_dict['theme'] = first_theme
                         else:
                             dataset_dict['theme'] = str(first_theme)
-                        log.debug(f"Fixed theme from JSON: {theme_value} -> {dataset_dict['theme']}")
+                        log.debug("Fixed theme from JSON: %s -> %s", theme_value, dataset_dict['theme'])
                 except (json.JSONDecodeError, IndexError):
                     # If not JSON, check if it's already a valid authority URI
                     if 'authority/data-theme/' in theme_value:
-                        log.debug(f"Theme is already a valid authority URI: {theme_value}")
+                        log.debug("Theme is already a valid authority URI: %s", theme_value)
                     else:
                         # If parsing fails and not valid URI, will move to tags below
                         pass
@@ -812,14 +893,14 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             return
 
         if not valid_codes:
-            log.debug(f"[{field_name.upper()}] No controlled vocabulary codes found, skipping normalization.")
+            log.debug("[%s] No controlled vocabulary codes found, skipping normalization.", field_name.upper())
             return
 
         value = dataset_dict[field_name]
 
         # If it's already a valid authority URI, keep it
         if isinstance(value, str) and uri_base in value:
-            log.debug(f"{field_name} is already a valid authority URI: {value}")
+            log.debug("%s is already a valid authority URI: %s", field_name, value)
             return
 
         # Handle arrays (e.g., theme can be array)
@@ -835,9 +916,9 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     item_code = item_code_original.upper()
                     if item_code and item_code in valid_codes:
                         cleaned_values.append(f"{uri_base}{item_code}")
-                        log.info(f"[{field_name.upper()}] Dynamically mapped: '{item}' -> '{uri_base}{item_code}'")
+                        log.info("[%s] Dynamically mapped: '%s' -> '%s%s'", field_name.upper(), item, uri_base, item_code)
                     else:
-                        log.debug(f"[{field_name.upper()}] Skipping unmapped value '{item}' (normalized: '{item_code}')")
+                        log.debug("[%s] Skipping unmapped value '%s' (normalized: '%s')", field_name.upper(), item, item_code)
 
             if cleaned_values:
                 dataset_dict[field_name] = cleaned_values
@@ -852,11 +933,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
 
             if value_code and value_code in valid_codes:
                 dataset_dict[field_name] = f"{uri_base}{value_code}"
-                log.info(f"[{field_name.upper()}] Dynamically mapped: '{value}' -> '{dataset_dict[field_name]}'")
+                log.info("[%s] Dynamically mapped: '%s' -> '%s'", field_name.upper(), value, dataset_dict[field_name])
             elif not value_code:
                 del dataset_dict[field_name]
             else:
-                log.debug(f"[{field_name.upper()}] Removing unmapped value '{value}' (normalized: '{value_code}')")
+                log.debug("[%s] Removing unmapped value '%s' (normalized: '%s')", field_name.upper(), value, value_code)
                 del dataset_dict[field_name]
 
     def _fix_frequency_field(self, dataset_dict):
@@ -1027,18 +1108,18 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
 
                                 if normalized_uri:
                                     dataset_dict['language'] = normalized_uri
-                                    log.info(f"[LANGUAGE] Moved valid language from extras: '{normalized_uri}'")
+                                    log.info("[LANGUAGE] Moved valid language from extras: '%s'", normalized_uri)
                                 else:
-                                    log.warning(f"[LANGUAGE] Language value '{language_uri}' not in controlled vocabulary")
+                                    log.warning("[LANGUAGE] Language value '%s' not in controlled vocabulary", language_uri)
                                 dataset_dict['extras'].remove(extra)
                     except (json.JSONDecodeError, IndexError):
                         # If not JSON, check if it's already a valid authority URI
                         normalized_uri = normalize_language_value(language_value)
                         if normalized_uri:
                             dataset_dict['language'] = normalized_uri
-                            log.info(f"[LANGUAGE] Moved valid language URI from extras: '{normalized_uri}'")
+                            log.info("[LANGUAGE] Moved valid language URI from extras: '%s'", normalized_uri)
                         else:
-                            log.warning(f"[LANGUAGE] Invalid language format in extras: {language_value}")
+                            log.warning("[LANGUAGE] Invalid language format in extras: %s", language_value)
                         dataset_dict['extras'].remove(extra)
                 break
 
@@ -1056,17 +1137,17 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                             normalized_uri = normalize_language_value(language_uri)
                             if normalized_uri:
                                 dataset_dict['language'] = normalized_uri
-                                log.info(f"[LANGUAGE] Fixed language in main field: '{normalized_uri}'")
+                                log.info("[LANGUAGE] Fixed language in main field: '%s'", normalized_uri)
                             else:
-                                log.warning(f"[LANGUAGE] Language value '{language_uri}' not in controlled vocabulary. Removing field.")
+                                log.warning("[LANGUAGE] Language value '%s' not in controlled vocabulary. Removing field.", language_uri)
                                 del dataset_dict['language']
                 except (json.JSONDecodeError, IndexError):
                     normalized_uri = normalize_language_value(language_value)
                     if normalized_uri:
                         dataset_dict['language'] = normalized_uri
-                        log.info(f"[LANGUAGE] Normalized language in main field: '{normalized_uri}'")
+                        log.info("[LANGUAGE] Normalized language in main field: '%s'", normalized_uri)
                     else:
-                        log.warning(f"[LANGUAGE] Invalid language format in main field: {language_value}")
+                        log.warning("[LANGUAGE] Invalid language format in main field: %s", language_value)
                         del dataset_dict['language']
 
     def _fix_resource_mimetype_fields(self, dataset_dict):
@@ -1184,7 +1265,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             else:
                 dataset_dict['notes_translated-el'] = 'Dataset description'
 
-        log.debug(f"Set required translated fields: title={dataset_dict.get('title_translated-el', 'N/A')[:50]}..., notes={dataset_dict.get('notes_translated-el', 'N/A')[:50]}...")
+        log.debug("Set required translated fields: title=%s..., notes=%s...", dataset_dict.get('title_translated-el', 'N/A')[:50], dataset_dict.get('notes_translated-el', 'N/A')[:50])
 
     def _fix_tag_validation(self, dataset_dict):
         """
@@ -1198,27 +1279,23 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             if isinstance(tag, dict) and 'name' in tag:
                 original_name = tag['name']
                 # Remove invalid characters and replace with valid alternatives
-                cleaned_name = original_name
-                cleaned_name = cleaned_name.replace('(', '-')  # Replace parentheses with hyphens
-                cleaned_name = cleaned_name.replace(')', '-')
-                cleaned_name = cleaned_name.replace('"', '')  # Remove quotes
-                cleaned_name = cleaned_name.replace("'", '')  # Remove apostrophes
+                cleaned_name = original_name.translate(_TAG_CHAR_REPLACEMENTS)
 
                 # Only keep alphanumeric characters, spaces, hyphens, underscores, and dots
-                cleaned_name = ''.join(char for char in cleaned_name if char.isalnum() or char in ' -_.')
+                cleaned_name = _TAG_DISALLOWED_CHARS_RE.sub('', cleaned_name)
 
                 # Remove multiple consecutive spaces and trim
                 cleaned_name = ' '.join(cleaned_name.split())
 
                 if cleaned_name and cleaned_name != original_name:
-                    log.debug(f"Cleaned tag: '{original_name}' -> '{cleaned_name}'")
+                    log.debug("Cleaned tag: '%s' -> '%s'", original_name, cleaned_name)
                     cleaned_tags.append({'name': cleaned_name})
                 elif cleaned_name:
                     cleaned_tags.append(tag)
                 else:
-                    log.warning(f"Removed invalid tag: '{original_name}'")
+                    log.warning("Removed invalid tag: '%s'", original_name)
             else:
-                log.warning(f"Invalid tag format: {tag}")
+                log.warning("Invalid tag format: %s", tag)
 
         dataset_dict['tags'] = cleaned_tags
 
@@ -1250,20 +1327,20 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
             else:
                 dataset_dict['notes_translated-el'] = dataset_dict.get('notes', 'Dataset description')
 
-        log.debug(f"Ensured required translated fields for: {dataset_dict.get('name', 'unknown')}")
+        log.debug("Ensured required translated fields for: %s", dataset_dict.get('name', 'unknown'))
 
     def _fix_resource_validation(self, dataset_dict):
         """
         Fix resource validation issues by ensuring required fields exist and are valid
         """
         if 'resources' not in dataset_dict or not dataset_dict['resources']:
-            log.warning(f"No resources found for dataset: {dataset_dict.get('name', 'unknown')}")
+            log.warning("No resources found for dataset: %s", dataset_dict.get('name', 'unknown'))
             return
 
         cleaned_resources = []
         for resource in dataset_dict['resources']:
             if not isinstance(resource, dict):
-                log.warning(f"Invalid resource format (not a dict): {resource}")
+                log.warning("Invalid resource format (not a dict): %s", resource)
                 continue
 
             # Ensure required resource fields exist
@@ -1277,7 +1354,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                 if fallback_url:
                     resource['url'] = fallback_url
                 else:
-                    log.warning(f"Resource missing URL, skipping: {resource.get('name', 'unnamed')}")
+                    log.warning("Resource missing URL, skipping: %s", resource.get('name', 'unnamed'))
                     continue
 
             # Fix resource name - required field
@@ -1465,11 +1542,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     cleaned_resource['description_translated'] = desc_trans
 
             cleaned_resources.append(cleaned_resource)
-            log.debug(f"Fixed resource: {cleaned_resource.get('name', 'unnamed')} - {cleaned_resource.get('format', 'unknown')}")
+            log.debug("Fixed resource: %s - %s", cleaned_resource.get('name', 'unnamed'), cleaned_resource.get('format', 'unknown'))
 
         # Replace resources with cleaned ones
         dataset_dict['resources'] = cleaned_resources
-        log.info(f"Resource validation completed for dataset '{dataset_dict.get('name', 'unknown')}'. Kept {len(cleaned_resources)} valid resources.")
+        log.info("Resource validation completed for dataset '%s'. Kept %d valid resources.", dataset_dict.get('name', 'unknown'), len(cleaned_resources))
 
     def _preserve_resource_level_licenses(self, dataset_dict, source_data):
         """
@@ -1514,11 +1591,11 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
                     # Inherit all available license fields from dataset
                     for field, value in dataset_licenses.items():
                         resource[field] = value
-                        log.debug(f"Inherited {field} to resource: {resource.get('name', 'unnamed')} -> {value}")
+                        log.debug("Inherited %s to resource: %s -> %s", field, resource.get('name', 'unnamed'), value)
                     resources_updated += 1
 
             if resources_updated > 0:
-                log.info(f"Applied dataset-level licenses to {resources_updated} resources")
+                log.info("Applied dataset-level licenses to %d resources", resources_updated)
 
         return
 
@@ -1557,7 +1634,7 @@ class CustomDcatHarvester(DCATRDFHarvester, IHarvester):
         # Preserve the phone number if found
         if phone:
             dataset_dict['contact_phone'] = phone
-            log.debug(f"Preserved contact phone: {phone}")
+            log.debug("Preserved contact phone: %s", phone)
 
             # Also add to extras for backup
             extras = dataset_dict.setdefault('extras', [])
@@ -10,7 +10,6 @@ from typing import List, Tuple, Optional
 from rdflib.namespace import RDF
 
 import ckan.plugins as plugins
-import ckan.plugins.toolkit as toolkit
 from ckan import model
 from ckanext.harvest.model import HarvestObject, HarvestObjectExtra
 from ckanext.harvest.interfaces import IHarvester
@@ -768,53 +767,6 @@ class EkanDcatHarvester(CustomDcatHarvester, IHarvester):
             # Non-fatal: extras recording is best-effort
             pass
 
-    def _get_vocabulary_uri_map(self, vocabulary_name: str) -> dict:
-        """Return mapping CODE -> value_uri for a given controlled vocabulary.
-
-        The mapping uses the same alias resolution as the base class, and
-        extracts codes from `value_uri` using `_extract_code_from_identifier`.
-        """
-        if not vocabulary_name:
-            return {}
-        alias_map = {
-            'access right': 'Access right',
-            'access rights': 'Access right',
-            'data theme': 'Data theme',
-            'dataset type': 'Dataset type',
-            'frequency': 'Frequency',
-            'high-value dataset categories': 'High-value dataset categories',
-            'language': 'Languages',
-            'languages': 'Languages',
-            'licence': 'Licence',
-            'license': 'Licence',
-            'media type': 'Media types',
-            'media types': 'Media types',
-            'mimetype': 'Media types',
-            'planned availability': 'Planned availability',
-            'publisher type': 'Publisher type',
-            'file type': 'File Type',
-            'file type - non proprietary format': 'File Type - Non Proprietary Format',
-            'machine readable file format': 'Machine Readable File Format',
-        }
-        lookup_name = alias_map.get(vocabulary_name.lower(), vocabulary_name)
-        try:
-            data = toolkit.get_action('vocabularyadmin_vocabulary_show')({}, {'id': lookup_name})
-            tags = data.get('tags', [])
-        except Exception:
-            return {}
-        mapping = {}
-        for tag in tags:
-            value_uri = tag.get('value_uri')
-            name = tag.get('name')
-            code = ''
-            if value_uri:
-                code = self._extract_code_from_identifier(value_uri)
-            if not code and name:
-                code = self._extract_code_from_identifier(name)
-            if code:
-                mapping[code.upper()] = value_uri or name
-        return mapping
-
     def _looks_like_url(self, value: Optional[str]) -> bool:
         if not value or not isinstance(value, str):
             return False
@@ -109,9 +109,15 @@ class DataGovGrPlugin(plugins.SingletonPlugin):
 
     def update_session(self, session):
         """
-        Leave the HTTP session unchanged (no custom headers/certs needed here).
+        Mount the pooled adapter shared by the data.gov.gr harvesters on
+        ckanext-dcat's session, so paged feeds reuse their connections.
+        The session itself, with whatever other plugins set on it, is
+        returned as received.
         """
-        return session
+        # Imported here: the harvesters package pulls in every harvester
+        from ckanext.data_gov_gr.harvesters.base import mount_http_adapter
+
+        return mount_http_adapter(session)
 
     def after_download(self, content, harvest_job):
         """
@@ -0,0 +1,312 @@
+import codecs
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ckanext.data_gov_gr.harvesters.attica_harvester import AtticaOpenDataHarvester
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'attica')
+
+DATASET_URL = (
+    'https://opendata.attica.gov.gr/content/gd-agrotikis-oikonomias/'
+    'd-ktiniatrikis/ktiniatrikes-adeies-2023'
+)
+
+
+RESOURCE_PAGE_INFO = {
+    'created': '12/01/2023 10:15',
+    'year': '2023',
+    'file_type': 'XLSX',
+    'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'size': '28 KB',
+    'hash': '2fd4e1c67a2d28fced849ee1bb76e7391b93eb12',
+}
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+
+def _response(body, content_type='text/html', status_code=200, headers=None):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp.headers = CaseInsensitiveDict({'Content-Type': content_type})
+    resp.headers.update(headers or {})
+    resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+    resp.raw = io.BytesIO(body)
+    return resp
+
+
+class TestSourceConfig(object):
+
+    def test_returns_parsed_config(self):
+        harvester = AtticaOpenDataHarvester()
+
+        assert harvester._get_source_config('{"start_page": 2}') == {'start_page': 2}
+        assert harvester._get_source_config('') == {}
+        assert harvester._get_source_config('not json') == {}
+
+    def test_caller_changes_do_not_leak_into_later_calls(self):
+        harvester = AtticaOpenDataHarvester()
+        source_config = '{"start_page": 3}'
+
+        config = harvester._get_source_config(source_config)
+        config.setdefault('end_page', 5)
+        config['start_page'] = 1
+
+        assert harvester._get_source_config(source_config) == {'start_page': 3}
+
+
+class TestResourcePageFetching(object):
+
+    def _extract(self, harvester):
+        soup = harvester._parse_html(_fixture('dataset.html'), harvester.DATASET_PAGE_STRAINER)
+        return harvester._extract_dataset_metadata(soup, DATASET_URL)
+
+    def test_resources_are_enriched_on_the_calling_thread(self):
+        harvester = AtticaOpenDataHarvester()
+        fetch_threads = []
+        apply_threads = []
+        apply_resource_page_info = harvester._apply_resource_page_info
+
+        def get_info(resource_page_url):
+            fetch_threads.append(threading.current_thread())
+            return {'size': '28 KB', 'file_type': 'XLSX', 'page': resource_page_url}
+
+        def apply_info(resource_data, info):
+            apply_threads.append(threading.current_thread())
+            apply_resource_page_info(resource_data, info)
+
+        with patch.object(harvester, '_get_resource_page_info', side_effect=get_info), \
+                patch.object(harvester, '_apply_resource_page_info', side_effect=apply_info):
+            dataset_data = self._extract(harvester)
+
+        resources = dataset_data['resources']
+        assert len(resources) == 2
+        for resource in resources:
+            assert resource['page'] == resource['preview_url']
+            assert resource['size'] == '28 KB'
+        # format comes from the dataset page, file_type does not override it
+        assert [r['format'] for r in resources] == ['XLSX', 'JSON']
+
+        assert all(t is not threading.current_thread() for t in fetch_threads)
+        assert apply_threads == [threading.current_thread()] * 2
+
+    def test_one_executor_serves_every_dataset(self):
+        harvester = AtticaOpenDataHarvester()
+        executor = harvester._resource_executor
+        fetch_threads = set()
+
+        def get_info(resource_page_url):
+            fetch_threads.add(threading.current_thread())
+            return {}
+
+        with patch.object(harvester, '_get_resource_page_info', side_effect=get_info):
+            for _ in range(5):
+                self._extract(harvester)
+
+        assert harvester._resource_executor is executor
+        assert 0 < len(fetch_threads) <= harvester.RESOURCE_FETCH_WORKERS
+        assert all(t.name.startswith('attica-resource-page') for t in fetch_threads)
+
+
+class TestResourcePageParsing(object):
+
+    def _parse(self, resp, chunk_size=None):
+        harvester = AtticaOpenDataHarvester()
+        if chunk_size:
+            harvester.RESOURCE_PAGE_CHUNK_SIZE = chunk_size
+        return harvester._parse_resource_page_info(resp)
+
+    @pytest.mark.parametrize('chunk_size', [None, 64, 16, 7])
+    def test_header_charset(self, chunk_size):
+        body = _fixture('resource.html').decode('utf-8').encode('cp1253')
+        resp = _response(body, 'text/html; charset=windows-1253')
+
+        assert self._parse(resp, chunk_size) == RESOURCE_PAGE_INFO
+
+    @pytest.mark.parametrize('chunk_size', [None, 64, 16, 7])
+    def test_meta_charset_only(self, chunk_size):
+        # the <meta charset> lies past the first chunk for the small sizes
+        resp = _response(_fixture('resource-windows-1253.html'))
+
+        assert self._parse(resp, chunk_size) == RESOURCE_PAGE_INFO
+
+    @pytest.mark.parametrize('chunk_size', [None, 64, 16, 7])
+    def test_no_charset_defaults_to_utf8(self, chunk_size):
+        resp = _response(_fixture('resource.html'))
+
+        assert self._parse(resp, chunk_size) == RESOURCE_PAGE_INFO
+
+    @pytest.mark.parametrize('bom, encoding', [
+        (codecs.BOM_UTF8, 'utf-8'),
+        (codecs.BOM_UTF16_LE, 'utf-16-le'),
+        (codecs.BOM_UTF16_BE, 'utf-16-be'),
+    ], ids=['utf-8', 'utf-16-le', 'utf-16-be'])
+    def test_bom_wins_over_header_charset(self, bom, encoding):
+        body = bom + _fixture('resource.html').decode('utf-8').encode(encoding)
+        resp = _response(body, 'text/html; charset=windows-1253')
+
+        assert self._parse(resp, 16) == RESOURCE_PAGE_INFO
+
+    def test_additional_info_spanning_chunks_stops_reading_after_table(self):
+        body = _fixture('resource.html')
+        resp = _response(body)
+
+        assert self._parse(resp, 64) == RESOURCE_PAGE_INFO
+        # the preview table after #additional-info is never downloaded
+        assert resp.raw.tell() < body.index(b'id="preview"')
+
+    def test_page_without_additional_info(self):
+        body = _fixture('resource.html').replace(b'id="additional-info"', b'id="other-info"')
+        resp = _response(body)
+
+        assert self._parse(resp, 64) == {}
+        assert resp.raw.tell() == len(body)
+
+
+class TestResourcePageCache(object):
+
+    URL = 'https://opendata.attica.gov.gr/content/ktiniatrikes-adeies-2023/adeies-xlsx'
+
+    def _get(self, harvester, responses, url=None):
+        with patch('ckanext.data_gov_gr.harvesters.attica_harvester.requests.get',
+                   side_effect=responses) as mock_get:
+            info = harvester._get_resource_page_info(url or self.URL)
+        return info, mock_get
+
+    def test_not_modified_reuses_cached_info(self):
+        harvester = AtticaOpenDataHarvester()
+        page = _fixture('resource.html')
+
+        info, _ = self._get(harvester, [_response(page, headers={'ETag': '"v1"'})])
+        assert info == RESOURCE_PAGE_INFO
+
+        with patch.object(harvester, '_parse_resource_page_info') as mock_parse:
+            info, mock_get = self._get(harvester, [_response(b'', status_code=304)])
+
+        assert info == RESOURCE_PAGE_INFO
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"v1"'}
+        mock_parse.assert_not_called()
+
+    def test_last_modified_is_sent_back(self):
+        harvester = AtticaOpenDataHarvester()
+        last_modified = 'Sat, 03 Feb 2024 09:00:00 GMT'
+
+        self._get(harvester, [_response(_fixture('resource.html'), headers={'Last-Modified': last_modified})])
+        info, mock_get = self._get(harvester, [_response(b'', status_code=304)])
+
+        assert info == RESOURCE_PAGE_INFO
+        assert mock_get.call_args[1]['headers'] == {'If-Modified-Since': last_modified}
+
+    def test_modified_page_replaces_cached_info(self):
+        harvester = AtticaOpenDataHarvester()
+        page = _fixture('resource.html')
+
+        self._get(harvester, [_response(page, headers={'ETag': '"v1"'})])
+        info, _ = self._get(harvester, [_response(page.replace(b'28 KB', b'30 KB'), headers={'ETag': '"v2"'})])
+
+        assert info['size'] == '30 KB'
+        assert harvester._resource_page_cache[self.URL]['etag'] == '"v2"'
+
+    def test_pages_without_validator_are_not_cached(self):
+        harvester = AtticaOpenDataHarvester()
+        page = _fixture('resource.html')
+
+        self._get(harvester, [_response(page)])
+        assert self.URL not in harvester._resource_page_cache
+
+        # a page that stops sending validators drops its stale entry
+        self._get(harvester, [_response(page, headers={'ETag': '"v1"'})])
+        self._get(harvester, [_response(page)])
+        assert self.URL not in harvester._resource_page_cache
+
+        _, mock_get = self._get(harvester, [_response(page)])
+        assert mock_get.call_args[1]['headers'] == {}
+
+    def test_least_recently_used_page_is_evicted(self):
+        harvester = AtticaOpenDataHarvester()
+        harvester.RESOURCE_PAGE_CACHE_SIZE = 2
+        page = _fixture('resource.html')
+        urls = [self.URL + str(i) for i in range(3)]
+
+        self._get(harvester, [_response(page, headers={'ETag': '"0"'})], urls[0])
+        self._get(harvester, [_response(page, headers={'ETag': '"1"'})], urls[1])
+        # urls[0] becomes the most recently used entry
+        self._get(harvester, [_response(b'', status_code=304)], urls[0])
+        self._get(harvester, [_response(page, headers={'ETag': '"2"'})], urls[2])
+
+        assert list(harvester._resource_page_cache) == [urls[0], urls[2]]
+
+    def test_failed_fetch_keeps_cached_entry(self):
+        harvester = AtticaOpenDataHarvester()
+
+        self._get(harvester, [_response(_fixture('resource.html'), headers={'ETag': '"v1"'})])
+        info, _ = self._get(harvester, [_response(b'', status_code=503)])
+
+        assert info == {}
+        assert harvester._resource_page_cache[self.URL]['info'] == RESOURCE_PAGE_INFO
+
+    def test_concurrent_fetches_share_the_cache(self):
+        harvester = AtticaOpenDataHarvester()
+        harvester.RESOURCE_PAGE_CACHE_SIZE = 8
+        page = _fixture('resource.html')
+        urls = [self.URL + str(i % 12) for i in range(200)]
+
+        def get(url, headers, **kwargs):
+            if headers.get('If-None-Match') == '"%s"' % url:
+                return _response(b'', status_code=304)
+            return _response(page, headers={'ETag': '"%s"' % url})
+
+        with patch('ckanext.data_gov_gr.harvesters.attica_harvester.requests.get', side_effect=get):
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(harvester._get_resource_page_info, urls))
+
+        assert results == [RESOURCE_PAGE_INFO] * len(urls)
+        cache = harvester._resource_page_cache
+        assert len(cache) == harvester.RESOURCE_PAGE_CACHE_SIZE
+        assert all(entry['etag'] == '"%s"' % url for url, entry in cache.items())
+
+
+class TestDatasetPageStrainer(object):
+
+    def _extract(self, use_strainers):
+        harvester = AtticaOpenDataHarvester()
+        harvester.USE_SOUP_STRAINERS = use_strainers
+        soup = harvester._parse_html(_fixture('dataset.html'), harvester.DATASET_PAGE_STRAINER)
+        with patch.object(harvester, '_get_resource_page_info', return_value={}):
+            return soup, harvester._extract_dataset_metadata(soup, DATASET_URL)
+
+    def test_strained_page_extracts_the_same_metadata(self):
+        _, strained = self._extract(use_strainers=True)
+        _, full = self._extract(use_strainers=False)
+
+        assert strained == full
+
+        assert strained['title'] == 'Κτηνιατρικές άδειες 2023'
+        assert strained['notes'] == 'Κατάλογος αδειών λειτουργίας κτηνιατρείων για το έτος 2023.'
+        assert strained['metadata_modified'] == '03/02/2024 09:00'
+        assert strained['license_title'] == 'Creative Commons Attribution 4.0'
+        assert strained['tags'] == ['Κτηνιατρική', 'Άδειες']
+        assert [r['name'] for r in strained['resources']] == ['Άδειες κτηνιατρείων', 'Άδειες (API)']
+        assert [c['name'] for c in strained['creator']] == [
+            'Γενική Διεύθυνση Αγροτικής Οικονομίας & Κτηνιατρικής',
+            'Διεύθυνση Κτηνιατρικής',
+        ]
+
+    def test_strained_page_keeps_only_the_extracted_elements(self):
+        soup, _ = self._extract(use_strainers=True)
+
+        assert soup.find('head') is None
+        assert soup.find('script') is None
+        assert soup.find('aside') is None
+        assert soup.find('nav', attrs={'aria-label': 'main'}) is None
+        assert soup.find('nav', attrs={'aria-label': 'breadcrumb'}, recursive=False) is not None
+        assert not soup.find_all(string='Κοινοποίηση')
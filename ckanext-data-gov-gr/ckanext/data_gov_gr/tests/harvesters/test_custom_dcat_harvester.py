@@ -0,0 +1,123 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ckanext.data_gov_gr.harvesters import custom_dcat_harvester
+from ckanext.data_gov_gr.harvesters.custom_dcat_harvester import CustomDcatHarvester
+
+
+def _catalog(*identifiers):
+    return json.dumps({
+        'dataset': [
+            {'identifier': identifier, 'title': 'Dataset %d' % i}
+            for i, identifier in enumerate(identifiers)
+        ]
+    })
+
+
+def _harvest_object(content, guid, job_id='job-1'):
+    return SimpleNamespace(content=content, guid=guid, job_id=job_id)
+
+
+def _harvester():
+    # Harvesters are singleton plugins, start every test without a catalog
+    harvester = CustomDcatHarvester()
+    harvester._catalog_cache = None
+    return harvester
+
+
+class TestCatalogSourceData(object):
+
+    def _extract(self, harvester, harvest_object):
+        return harvester._extract_source_data_from_harvest_object(harvest_object)
+
+    def test_catalog_is_parsed_once_per_job(self):
+        harvester = _harvester()
+        content = _catalog('a', 'b', 'c')
+
+        with patch.object(custom_dcat_harvester, 'json_loads', wraps=json.loads) as mock_loads:
+            for guid in ('a', 'b', 'c'):
+                assert self._extract(harvester, _harvest_object(content, guid))['identifier'] == guid
+
+        assert mock_loads.call_count == 1
+
+    def test_new_job_drops_the_previous_catalog(self):
+        harvester = _harvester()
+        content = _catalog('a', 'b')
+
+        self._extract(harvester, _harvest_object(content, 'a', job_id='job-1'))
+        with patch.object(custom_dcat_harvester, 'json_loads', wraps=json.loads) as mock_loads:
+            assert self._extract(harvester, _harvest_object(content, 'b', job_id='job-2'))['identifier'] == 'b'
+
+        assert mock_loads.call_count == 1
+        assert harvester._catalog_cache[0] == 'job-2'
+
+    def test_changed_content_within_a_job_is_parsed_again(self):
+        harvester = _harvester()
+
+        self._extract(harvester, _harvest_object(_catalog('a', 'b'), 'a'))
+        source_data = self._extract(harvester, _harvest_object(_catalog('x', 'b'), 'x'))
+
+        assert source_data == {'identifier': 'x', 'title': 'Dataset 0'}
+
+    def test_returned_entry_is_a_copy(self):
+        harvester = _harvester()
+        content = _catalog('a')
+
+        self._extract(harvester, _harvest_object(content, 'a'))['title'] = 'changed'
+
+        assert self._extract(harvester, _harvest_object(content, 'a'))['title'] == 'Dataset 0'
+
+    def test_first_dataset_ending_with_guid_wins(self):
+        harvester = _harvester()
+        # the URI of the first dataset ends with the identifier of the second
+        content = _catalog('https://example.org/dataset/abc', 'abc')
+
+        source_data = self._extract(harvester, _harvest_object(content, 'abc'))
+
+        assert source_data['identifier'] == 'https://example.org/dataset/abc'
+
+    def test_exact_match_wins_over_later_uri(self):
+        harvester = _harvester()
+        content = _catalog('abc', 'https://example.org/dataset/abc')
+
+        assert self._extract(harvester, _harvest_object(content, 'abc'))['title'] == 'Dataset 0'
+
+    def test_identifier_lists_and_keys(self):
+        harvester = _harvester()
+        content = json.dumps({'@graph': [
+            'not a dataset',
+            {'title': 'no identifier'},
+            {'@id': 'https://example.org/dataset/one', 'title': 'one'},
+            {'id': ['urn:x:2', 'https://example.org/dataset/two'], 'title': 'two'},
+        ]})
+
+        assert self._extract(harvester, _harvest_object(content, 'one'))['title'] == 'one'
+        assert self._extract(harvester, _harvest_object(content, 'dataset/two'))['title'] == 'two'
+        assert self._extract(harvester, _harvest_object(content, 'urn:x:2'))['title'] == 'two'
+
+    def test_no_match_returns_the_whole_catalog(self):
+        harvester = _harvester()
+        content = _catalog('a', 'b')
+
+        assert self._extract(harvester, _harvest_object(content, 'abc')) == json.loads(content)
+
+
+class TestHvdCategory(object):
+
+    BNA_URI = 'http://data.europa.eu/bna/c_a9135398'
+
+    def test_uris_embedding_the_bna_path_are_kept(self):
+        values = [self.BNA_URI, ' ' + self.BNA_URI, 'https://data.europa.eu/bna/c_164e0bf5', 'https://example.org/x']
+        dataset_dict = {'hvd_category': list(values)}
+
+        _harvester()._fix_hvd_category(dataset_dict)
+
+        assert dataset_dict['hvd_category'] == values[:3]
+
+    def test_single_uri_becomes_a_list(self):
+        dataset_dict = {'hvd_category': ' ' + self.BNA_URI}
+
+        _harvester()._fix_hvd_category(dataset_dict)
+
+        assert dataset_dict['hvd_category'] == [' ' + self.BNA_URI]
@@ -79,21 +79,26 @@ class DCATHarvester(HarvesterBase):
                     file size: {allowed}, Content-Length: {actual}.'''.format(
                     allowed=max_file_size, actual=cl)
                 self._save_gather_error(msg, harvest_job)
+                # Hand a streamed GET's connection back to the pool
+                r.close()
                 return None, None
 
             if not did_get:
                 r = session.get(url, stream=True)
 
             length = 0
-            content = b''
+            # bytearray grows in place; concatenating bytes copied the whole
+            # download again for every chunk
+            content = bytearray()
             for chunk in r.iter_content(chunk_size=self.CHUNK_SIZE):
-                content = content + chunk
+                content += chunk
 
                 length += len(chunk)
 
                 if length >= max_file_size:
                     self._save_gather_error('Remote file is too big.',
                                             harvest_job)
+                    r.close()
                     return None, None
 
             content = content.decode('utf-8')